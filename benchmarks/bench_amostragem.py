@@ -0,0 +1,51 @@
+"""
+Mede `contagem_palavras.contar_palavras` e `amostrar_palavras` num AFD minimizado.
+
+Uso: python3 benchmarks/bench_amostragem.py [expressao] [comprimento] [quantidade]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from contagem_palavras import amostrar_palavras, contar_palavras  # noqa: E402
+from converter_minimizar_afd import minimizar_afd  # noqa: E402
+from converter_regex import regex_para_afd  # noqa: E402
+
+
+def verificar_contagens_grandes():
+    """
+    Regressão: AFD cuja contagem a partir do inicial cabe em int64, mas a de um
+    estado interno não (16 símbolos, cadeia q0 -a-> ... -a-> q5, q5 aceita tudo).
+    """
+    alfabeto = [chr(ord("a") + i) for i in range(16)]
+    estados = [f"q{i}" for i in range(6)]
+    transicoes = {f"q{i}": {"a": f"q{i + 1}"} for i in range(5)}
+    transicoes["q5"] = {s: "q5" for s in alfabeto}
+    palavras = amostrar_palavras(alfabeto, estados, "q0", ["q5"], transicoes, 18, 100, semente=0)
+    assert all(len(w) == 18 and w.startswith("aaaaa") for w in palavras)
+    print("verificação com contagens acima de int64: ok")
+
+
+def main():
+    expressao = sys.argv[1] if len(sys.argv) > 1 else "(a|b)*abb(a|b)*"
+    comprimento = int(sys.argv[2]) if len(sys.argv) > 2 else 30
+    quantidade = int(sys.argv[3]) if len(sys.argv) > 3 else 1_000_000
+
+    verificar_contagens_grandes()
+
+    afd = minimizar_afd(*regex_para_afd(expressao))
+
+    inicio = time.perf_counter()
+    contagens = contar_palavras(*afd, comprimento)
+    print(f"contagem até {comprimento}: {time.perf_counter() - inicio:.3f}s "
+          f"({contagens[comprimento]} palavras de comprimento {comprimento})")
+
+    inicio = time.perf_counter()
+    palavras = amostrar_palavras(*afd, comprimento, quantidade, semente=0)
+    print(f"amostragem de {len(palavras)} palavras: {time.perf_counter() - inicio:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
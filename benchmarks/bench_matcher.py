@@ -0,0 +1,59 @@
+"""
+Compara a simulação genérica (`Automato.aceita` e a tabela do AFD) com os
+casadores gerados por `gerar_matcher.compilar_matcher` (estilos "if" e "dict").
+
+Uso: python3 benchmarks/bench_matcher.py [expressao] [num_palavras]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from converter_minimizar_afd import minimizar_afd  # noqa: E402
+from converter_regex import regex_para_afd, regex_para_automato  # noqa: E402
+from gerar_matcher import compilar_matcher  # noqa: E402
+
+
+def main():
+    expressao = sys.argv[1] if len(sys.argv) > 1 else "(a|b)*abb(a|b)*"
+    quantidade = int(sys.argv[2]) if len(sys.argv) > 2 else 20000
+
+    automato = regex_para_automato(expressao)
+    afd = minimizar_afd(*regex_para_afd(expressao))
+    _, _, inicial, finais, transicoes = afd
+    finais_set = set(finais)
+
+    def tabela(palavra):
+        estado = inicial
+        for c in palavra:
+            estado = transicoes.get(estado, {}).get(c)
+            if estado is None:
+                return False
+        return estado in finais_set
+
+    rng = random.Random(0)
+    simbolos = sorted(automato.alfabeto)
+    palavras = ["".join(rng.choice(simbolos) for _ in range(rng.randint(0, 40))) for _ in range(quantidade)]
+
+    motores = [
+        ("Automato.aceita", automato.aceita),
+        ("tabela do AFD", tabela),
+        ("gerado (if)", compilar_matcher(*afd, modo="if")),
+        ("gerado (dict)", compilar_matcher(*afd, modo="dict")),
+    ]
+    esperado = None
+    print(f"{'motor':<18}{'tempo (s)':>12}{'palavras/s':>14}")
+    for nome, casar in motores:
+        inicio = time.perf_counter()
+        resultado = [casar(w) for w in palavras]
+        tempo = time.perf_counter() - inicio
+        if esperado is None:
+            esperado = resultado
+        assert resultado == esperado, nome
+        print(f"{nome:<18}{tempo:>12.3f}{quantidade / tempo:>14.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Compara a memória ocupada por `Automato` e `AutomatoCompacto`.
+
+Gera autômatos aleatórios quase determinísticos (cada par estado×símbolo
+tem um destino e, com pequena probabilidade, um segundo) e mede com
+tracemalloc a memória retida por cada representação, em bytes por transição.
+
+Uso: python3 benchmarks/bench_memoria.py [estados ...]
+"""
+import gc
+import os
+import random
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from testar_palavra import Automato  # noqa: E402
+from automato_compacto import AutomatoCompacto  # noqa: E402
+
+ALFABETO = [chr(ord("a") + i) for i in range(8)]
+
+
+def gerar_triplas(n, prob_extra=0.05, semente=0):
+    rng = random.Random(semente)
+    estados = [f"q{i}" for i in range(n)]
+    triplas = []
+    for o in estados:
+        for s in ALFABETO:
+            triplas.append((o, rng.choice(estados), s))
+            if rng.random() < prob_extra:
+                triplas.append((o, rng.choice(estados), s))
+    return estados, triplas
+
+
+def _construir_automato(estados, triplas):
+    transicoes = {}
+    for o, d, s in triplas:
+        transicoes.setdefault(o, {}).setdefault(s, set()).add(d)
+    return Automato(estados, ALFABETO, estados[:1], estados[-1:], transicoes)
+
+
+def _construir_compacto(estados, triplas):
+    return AutomatoCompacto.from_triplas(estados, ALFABETO, estados[:1], estados[-1:], triplas)
+
+
+def medir(construir, estados, triplas):
+    gc.collect()
+    tracemalloc.start()
+    antes = tracemalloc.get_traced_memory()[0]
+    obj = construir(estados, triplas)
+    gc.collect()
+    depois = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del obj
+    return depois - antes
+
+
+def main():
+    tamanhos = [int(x) for x in sys.argv[1:]] or [1000, 10000, 50000]
+    print(f"{'estados':>8}{'transições':>12}{'Automato (B/t)':>18}{'Compacto (B/t)':>18}{'razão':>8}")
+    for n in tamanhos:
+        estados, triplas = gerar_triplas(n)
+        # os nomes dos estados pertencem à entrada e não entram na medição
+        b_dict = medir(_construir_automato, estados, triplas)
+        b_comp = medir(_construir_compacto, estados, triplas)
+        t = len(set(triplas))
+        print(f"{n:>8}{t:>12}{b_dict / t:>18.1f}{b_comp / t:>18.1f}{b_dict / b_comp:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Compara os dois motores de minimização: `minimizar_afd` (Hopcroft) e
+`minimizar_afd_moore` (refinamento de Moore vetorizado com NumPy).
+
+Dois tipos de AFD completo são gerados:
+  - raso: transições aleatórias; a partição estabiliza em poucas rodadas
+  - profundo: uma cadeia q0 → q1 → ... → qN com um único final no fim; o
+    refinamento de Moore precisa de ~N rodadas
+
+Uso: python3 benchmarks/bench_minimizacao.py [estados ...]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from converter_minimizar_afd import minimizar_afd, minimizar_afd_moore  # noqa: E402
+
+ALFABETO = ["a", "b", "c", "d"]
+
+
+def afd_raso(n, semente=0):
+    rng = random.Random(semente)
+    estados = [f"q{i}" for i in range(n)]
+    transicoes = {e: {s: rng.choice(estados) for s in ALFABETO} for e in estados}
+    finais = [e for e in estados if rng.random() < 0.3]
+    return ALFABETO, estados, estados[0], finais, transicoes
+
+
+def afd_profundo(n):
+    estados = [f"q{i}" for i in range(n)]
+    transicoes = {}
+    for i, e in enumerate(estados):
+        prox = estados[min(i + 1, n - 1)]
+        transicoes[e] = {s: (prox if s == "a" else estados[0]) for s in ALFABETO}
+    return ALFABETO, estados, estados[0], [estados[-1]], transicoes
+
+
+def verificar_afds_parciais(quantidade=2000, semente=0):
+    """Os dois motores devem dar a mesma saída também em AFDs parciais."""
+    rng = random.Random(semente)
+    for _ in range(quantidade):
+        n = rng.randint(1, 8)
+        estados = [f"q{i}" for i in range(n)]
+        transicoes = {
+            e: {s: rng.choice(estados) for s in ALFABETO[:2] if rng.random() < 0.7}
+            for e in estados
+        }
+        finais = [e for e in estados if rng.random() < 0.3]
+        afd = (ALFABETO[:2], estados, estados[0], finais, transicoes)
+        assert minimizar_afd(*afd) == minimizar_afd_moore(*afd), afd
+    print(f"verificação em {quantidade} AFDs parciais: ok")
+
+
+def _tempo(funcao, afd):
+    inicio = time.perf_counter()
+    resultado = funcao(*afd)
+    return time.perf_counter() - inicio, len(resultado[1])
+
+
+def main():
+    tamanhos = [int(x) for x in sys.argv[1:]] or [200, 1000, 5000]
+    verificar_afds_parciais()
+    print(f"{'tipo':<10}{'estados':>8}{'mínimo':>8}{'Hopcroft (s)':>14}{'Moore (s)':>12}")
+    for tipo, gerar in (("raso", afd_raso), ("profundo", afd_profundo)):
+        for n in tamanhos:
+            afd = gerar(n)
+            t_h, m_h = _tempo(minimizar_afd, afd)
+            t_m, m_m = _tempo(minimizar_afd_moore, afd)
+            assert m_h == m_m
+            print(f"{tipo:<10}{n:>8}{m_h:>8}{t_h:>14.3f}{t_m:>12.3f}")
+
+
+if __name__ == "__main__":
+    main()
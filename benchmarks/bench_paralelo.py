@@ -0,0 +1,47 @@
+"""
+Escalabilidade de `afd_paralelo.converter_afn_para_afd_paralelo` em relação a
+`converter_afn_para_afd`, com 1, 2, 4, ... processos (até os.cpu_count()).
+
+O AFN é o de (a|b)*a(a|b)^n, cujo AFD tem 2^(n+1) estados.
+
+Uso: python3 benchmarks/bench_paralelo.py [n] [processos ...]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from afd_paralelo import converter_afn_para_afd_paralelo  # noqa: E402
+from converterAFNparaAFD import converter_afn_para_afd  # noqa: E402
+from converter_regex import regex_para_automato  # noqa: E402
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 15
+    cpus = os.cpu_count() or 1
+    contagens = [int(x) for x in sys.argv[2:]]
+    if not contagens:
+        contagens = [1]
+        while contagens[-1] * 2 <= cpus:
+            contagens.append(contagens[-1] * 2)
+
+    afn = regex_para_automato("(a|b)*a" + "(a|b)" * n)
+
+    inicio = time.perf_counter()
+    referencia = converter_afn_para_afd(afn)
+    base = time.perf_counter() - inicio
+    print(f"{len(referencia[1])} estados no AFD, {cpus} CPUs")
+    print(f"{'motor':<22}{'tempo (s)':>10}{'aceleração':>12}")
+    print(f"{'sequencial':<22}{base:>10.3f}{1.0:>12.2f}")
+
+    for processos in contagens:
+        inicio = time.perf_counter()
+        resultado = converter_afn_para_afd_paralelo(afn, processos=processos)
+        tempo = time.perf_counter() - inicio
+        assert resultado == referencia
+        print(f"{f'paralelo ({processos} proc.)':<22}{tempo:>10.3f}{base / tempo:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
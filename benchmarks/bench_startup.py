@@ -0,0 +1,56 @@
+"""
+Mede o tempo de inicialização do programa de linha de comando.
+
+Para cada cenário, executa o interpretador N vezes em processos novos e
+reporta a média e o mínimo (em milissegundos). Também mostra o custo de
+importar cada módulo de `src/` isoladamente.
+
+Uso: python3 benchmarks/bench_startup.py [repeticoes]
+"""
+import os
+import subprocess
+import sys
+import time
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SRC = os.path.join(RAIZ, "src")
+AUTOMATO = os.path.join(RAIZ, "automato.json")
+
+MODULOS = [
+    "testar_palavra",
+    "converterAFNEpAFN",
+    "converterAFNparaAFD",
+    "converter_minimizar_afd",
+    "converter_multi_para_afne",
+    "main",
+]
+
+
+def _medir(cmd, repeticoes):
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        subprocess.run(cmd, cwd=SRC, stdout=subprocess.DEVNULL, check=False)
+        tempos.append((time.perf_counter() - inicio) * 1000)
+    return sum(tempos) / len(tempos), min(tempos)
+
+
+def main():
+    repeticoes = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    py = sys.executable
+
+    cenarios = [
+        ("python vazio", [py, "-c", "pass"]),
+        ("main.py testar", [py, os.path.join(SRC, "main.py"), "testar", AUTOMATO, "ab", "aba"]),
+    ]
+    for modulo in MODULOS:
+        cenarios.append((f"import {modulo}", [py, "-c", f"import {modulo}"]))
+
+    print(f"{'cenário':<36}{'média (ms)':>12}{'mín (ms)':>12}")
+    for nome, cmd in cenarios:
+        media, minimo = _medir(cmd, repeticoes)
+        print(f"{nome:<36}{media:>12.2f}{minimo:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
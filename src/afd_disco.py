@@ -0,0 +1,202 @@
+import os
+import sqlite3
+import tempfile
+from array import array
+from collections import OrderedDict
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from testar_palavra import Automato, EPSILON
+from converterAFNparaAFD import DEAD
+
+
+# Método dos subconjuntos em memória externa: a tabela de subconjuntos visitados
+# e as transições do AFD ficam num banco sqlite em disco. Na memória ficam só o
+# AFN, o lote de estados sendo expandido e um cache LRU limitado de
+# subconjunto -> id. Os ids são atribuídos em ordem de descoberta, então a fila da
+# BFS é simplesmente "o próximo id ainda não expandido".
+#
+# Cada subconjunto é guardado como os ids (ordenados) dos estados do AFN num
+# array('i') serializado.
+
+_ESQUEMA = """
+CREATE TABLE IF NOT EXISTS alfabeto (id INTEGER PRIMARY KEY, simbolo TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS estados_afn (id INTEGER PRIMARY KEY, nome TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS subconjuntos (
+    id INTEGER PRIMARY KEY, chave BLOB NOT NULL UNIQUE, final INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS transicoes (origem INTEGER NOT NULL, simbolo INTEGER NOT NULL, destino INTEGER NOT NULL);
+"""
+
+
+class AFDEmDisco:
+    """
+    AFD resultante de `converter_afn_para_afd_disco`, lido sob demanda do banco.
+    O estado inicial tem id 0.
+
+    Com temporario=True o arquivo pertence a este objeto e é apagado em
+    `fechar()` (também chamado ao sair de um bloco `with`).
+    """
+
+    __slots__ = ("caminho", "conexao", "alfabeto", "nomes_afn", "temporario")
+
+    def __init__(self, caminho: str, temporario: bool = False) -> None:
+        self.caminho = caminho
+        self.temporario = temporario
+        self.conexao = sqlite3.connect(caminho)
+        self.alfabeto: List[str] = [s for (s,) in self.conexao.execute("SELECT simbolo FROM alfabeto ORDER BY id")]
+        self.nomes_afn: List[str] = [n for (n,) in self.conexao.execute("SELECT nome FROM estados_afn ORDER BY id")]
+
+    def num_estados(self) -> int:
+        return self.conexao.execute("SELECT COUNT(*) FROM subconjuntos").fetchone()[0]
+
+    def _nome_da_chave(self, chave: bytes) -> str:
+        ids = array("i")
+        ids.frombytes(chave)
+        if not ids:
+            return DEAD
+        return ",".join(self.nomes_afn[i] for i in ids)
+
+    def nome(self, id_estado: int) -> str:
+        linha = self.conexao.execute("SELECT chave FROM subconjuntos WHERE id = ?", (id_estado,)).fetchone()
+        if linha is None:
+            raise KeyError(id_estado)
+        return self._nome_da_chave(linha[0])
+
+    def estados(self) -> Iterator[Tuple[int, str, bool]]:
+        """Itera (id, nome, é_final) sem carregar a tabela inteira."""
+        for id_estado, chave, final in self.conexao.execute("SELECT id, chave, final FROM subconjuntos ORDER BY id"):
+            yield id_estado, self._nome_da_chave(chave), bool(final)
+
+    def transicoes(self) -> Iterator[Tuple[int, str, int]]:
+        """Itera (id_origem, simbolo, id_destino)."""
+        for origem, simbolo, destino in self.conexao.execute("SELECT origem, simbolo, destino FROM transicoes"):
+            yield origem, self.alfabeto[simbolo], destino
+
+    def para_tupla(self):
+        """
+        Carrega o AFD em memória no formato de `converter_afn_para_afd`
+        (alfabeto, estados, inicial, finais, transicoes). Só para resultados que
+        cabem na memória.
+        """
+        nomes: Dict[int, str] = {}
+        finais: List[str] = []
+        for id_estado, nome, final in self.estados():
+            nomes[id_estado] = nome
+            if final:
+                finais.append(nome)
+        transicoes: Dict[str, Dict[str, str]] = {n: {} for n in nomes.values()}
+        for origem, simbolo, destino in self.transicoes():
+            transicoes[nomes[origem]][simbolo] = nomes[destino]
+        return list(self.alfabeto), sorted(nomes.values()), nomes[0], sorted(finais), transicoes
+
+    def fechar(self) -> None:
+        self.conexao.close()
+        if self.temporario:
+            self.temporario = False
+            try:
+                os.remove(self.caminho)
+            except FileNotFoundError:
+                pass
+
+    def __enter__(self) -> "AFDEmDisco":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.fechar()
+
+
+def converter_afn_para_afd_disco(afn: Automato, caminho: Optional[str] = None,
+                                 max_cache: int = 100_000, tamanho_lote: int = 10_000) -> AFDEmDisco:
+    """
+    Converte um AFN em AFD gravando subconjuntos e transições em `caminho`
+    (sqlite; se omitido, um arquivo temporário apagado por `AFDEmDisco.fechar`
+    ou ao sair do bloco `with`). `max_cache` limita quantos subconjuntos ficam
+    no cache em memória e `tamanho_lote` quantos estados são expandidos por
+    transação.
+
+    Gera o mesmo AFD de `converter_afn_para_afd` (ver `AFDEmDisco.para_tupla`).
+    """
+    for mapa in afn.transicoes.values():
+        if EPSILON in mapa:
+            raise ValueError("AFN contém transições ε. Use a conversão AFN-ε → AFN antes (opção 1).")
+
+    temporario = caminho is None
+    if temporario:
+        fd, caminho = tempfile.mkstemp(suffix=".sqlite", prefix="afd_")
+        os.close(fd)
+    elif os.path.exists(caminho):
+        os.remove(caminho)
+
+    alfabeto = sorted(afn.alfabeto)
+    nomes = sorted(afn.estados)
+    indice = {n: i for i, n in enumerate(nomes)}
+    tabela: List[List[Tuple[int, ...]]] = [
+        [tuple(indice[d] for d in afn.transicoes.get(n, {}).get(s, ())) for s in alfabeto]
+        for n in nomes
+    ]
+    finais = {indice[f] for f in afn.finais}
+
+    con = sqlite3.connect(caminho)
+    try:
+        # o arquivo é um resultado intermediário: durabilidade não importa
+        con.execute("PRAGMA journal_mode = OFF")
+        con.execute("PRAGMA synchronous = OFF")
+        con.executescript(_ESQUEMA)
+        con.executemany("INSERT INTO alfabeto VALUES (?, ?)", enumerate(alfabeto))
+        con.executemany("INSERT INTO estados_afn VALUES (?, ?)", enumerate(nomes))
+
+        cache: "OrderedDict[bytes, int]" = OrderedDict()
+        proximo_id = 0
+
+        def id_de(ids: Set[int]) -> int:
+            nonlocal proximo_id
+            chave = array("i", sorted(ids)).tobytes()
+            encontrado = cache.get(chave)
+            if encontrado is not None:
+                cache.move_to_end(chave)
+                return encontrado
+            linha = con.execute("SELECT id FROM subconjuntos WHERE chave = ?", (chave,)).fetchone()
+            if linha is not None:
+                encontrado = linha[0]
+            else:
+                encontrado = proximo_id
+                proximo_id += 1
+                con.execute("INSERT INTO subconjuntos VALUES (?, ?, ?)",
+                            (encontrado, chave, int(not finais.isdisjoint(ids))))
+            cache[chave] = encontrado
+            if len(cache) > max_cache:
+                cache.popitem(last=False)
+            return encontrado
+
+        id_de({indice[e] for e in afn.iniciais})
+
+        expandidos = 0
+        while expandidos < proximo_id:
+            fim = min(proximo_id, expandidos + tamanho_lote)
+            lote = con.execute(
+                "SELECT id, chave FROM subconjuntos WHERE id >= ? AND id < ? ORDER BY id", (expandidos, fim)
+            ).fetchall()
+            saida: List[Tuple[int, int, int]] = []
+            for origem, chave in lote:
+                ids = array("i")
+                ids.frombytes(chave)
+                linhas = [tabela[e] for e in ids]
+                for i in range(len(alfabeto)):
+                    prox: Set[int] = set()
+                    for linha in linhas:
+                        prox.update(linha[i])
+                    saida.append((origem, i, id_de(prox)))
+            con.executemany("INSERT INTO transicoes VALUES (?, ?, ?)", saida)
+            con.commit()
+            expandidos = fim
+
+        con.execute("CREATE INDEX IF NOT EXISTS transicoes_origem ON transicoes (origem)")
+        con.commit()
+    except BaseException:
+        con.close()
+        if temporario:
+            os.remove(caminho)
+        raise
+    con.close()
+
+    return AFDEmDisco(caminho, temporario=temporario)
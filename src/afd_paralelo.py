@@ -0,0 +1,296 @@
+import os
+import pickle
+from typing import Dict, List, Optional, Set, Tuple
+
+from testar_palavra import Automato, EPSILON
+from converterAFNparaAFD import DEAD
+
+
+# Método dos subconjuntos paralelo, com a tabela de visitados particionada entre
+# processos. Cada processo é dono dos subconjuntos cujo hash cai na sua partição
+# (hash de tupla de inteiros é o mesmo em todos os processos): é ele que detecta
+# duplicatas, atribui ids (id = posição_local * num_partes + parte), expande os
+# estados novos e, no fim, monta os nomes e o trecho do dict de transições dos
+# seus estados. A BFS avança em níveis sincronizados:
+#   1. expandir: cada parte calcula os sucessores da sua fronteira e os separa em
+#      baldes pela parte dona de cada subconjunto sucessor
+#   2. registrar: cada parte recebe os baldes endereçados a ela, deduplica e
+#      forma a próxima fronteira
+# O processo principal só repassa os baldes, já serializados pelos processos
+# (bytes de pickle, sem desserializar), e junta os dicts finais com dict.update.
+# Enquanto a fronteira é pequena, a BFS roda numa única parte no próprio
+# processo; quando ela atinge `fronteira_minima`, os estados já descobertos são
+# redistribuídos entre as partes e os processos são criados. AFNs pequenos nunca
+# criam processos. O AFD resultante é igual ao de `converter_afn_para_afd`.
+
+Subconjunto = Tuple[int, ...]
+
+
+class _Parte:
+    """Uma partição da tabela de visitados e os estados do AFD que ela possui."""
+
+    def __init__(self, parte: int, num_partes: int, tabela: List[List[Subconjunto]],
+                 alfabeto: List[str], nomes: List[str], finais: Set[int], estado=None) -> None:
+        self.parte = parte
+        self.num_partes = num_partes
+        self.tabela = tabela
+        self.alfabeto = alfabeto
+        self.nomes = nomes
+        self.finais = finais
+        self.ids: Dict[Subconjunto, int] = {}
+        self.subconjuntos: List[Subconjunto] = []  # posição local -> subconjunto
+        self.fronteira: List[int] = []  # posições locais ainda não expandidas
+        self.recebidas: List[Tuple[int, int, int]] = []  # (id_origem, simbolo, id_destino)
+        self.mortas: List[Tuple[int, int]] = []  # (posição local da origem, simbolo) -> DEAD
+        if estado is not None:
+            # estado vindo de `_redistribuir`
+            self.subconjuntos, self.fronteira, self.recebidas, self.mortas = estado
+            self.ids = {s: local * num_partes + parte for local, s in enumerate(self.subconjuntos)}
+
+    def _baldes(self, itens) -> List[bytes]:
+        baldes: List[list] = [[] for _ in range(self.num_partes)]
+        for item, dono in itens:
+            baldes[dono].append(item)
+        return [pickle.dumps(b, protocol=pickle.HIGHEST_PROTOCOL) for b in baldes]
+
+    def expandir(self) -> List[bytes]:
+        """Sucessores da fronteira, em baldes (serializados) por parte dona."""
+        n = self.num_partes
+        num_simbolos = len(self.alfabeto)
+
+        def sucessores():
+            for local in self.fronteira:
+                origem = local * n + self.parte
+                linhas = [self.tabela[e] for e in self.subconjuntos[local]]
+                for i in range(num_simbolos):
+                    prox: Set[int] = set()
+                    for linha in linhas:
+                        prox.update(linha[i])
+                    if not prox:
+                        self.mortas.append((local, i))
+                        continue
+                    subconjunto = tuple(sorted(prox))
+                    yield (origem, i, subconjunto), hash(subconjunto) % n
+
+        baldes = self._baldes(sucessores())
+        self.fronteira = []
+        return baldes
+
+    def registrar(self, baldes: List[bytes]) -> int:
+        """Deduplica os subconjuntos recebidos; retorna quantos estados novos surgiram."""
+        n = self.num_partes
+        for dados in baldes:
+            for origem, i, subconjunto in pickle.loads(dados):
+                id_destino = self.ids.get(subconjunto)
+                if id_destino is None:
+                    local = len(self.subconjuntos)
+                    id_destino = local * n + self.parte
+                    self.ids[subconjunto] = id_destino
+                    self.subconjuntos.append(subconjunto)
+                    self.fronteira.append(local)
+                if origem >= 0:
+                    self.recebidas.append((origem, i, id_destino))
+        return len(self.fronteira)
+
+    def _nome(self, local: int) -> str:
+        subconjunto = self.subconjuntos[local]
+        if not subconjunto:
+            return DEAD
+        return ",".join(self.nomes[e] for e in subconjunto)
+
+    def enviar_transicoes(self) -> List[bytes]:
+        """Transições recebidas, com o nome do destino, em baldes pela parte dona da origem."""
+        n = self.num_partes
+        self.nomes_locais = [self._nome(local) for local in range(len(self.subconjuntos))]
+        itens = (((origem, i, self.nomes_locais[d // n]), origem % n) for origem, i, d in self.recebidas)
+        baldes = self._baldes(itens)
+        self.recebidas = []
+        return baldes
+
+    def montar(self, baldes: List[bytes]):
+        """(trecho de transições, finais, usa estado morto) dos estados desta parte."""
+        n = self.num_partes
+        nomes_locais = self.nomes_locais
+        transicoes: Dict[str, Dict[str, str]] = {nome: {} for nome in nomes_locais}
+        for dados in baldes:
+            for origem, i, destino in pickle.loads(dados):
+                transicoes[nomes_locais[origem // n]][self.alfabeto[i]] = destino
+        for local, i in self.mortas:
+            transicoes[nomes_locais[local]][self.alfabeto[i]] = DEAD
+        finais = [
+            nomes_locais[local]
+            for local, subconjunto in enumerate(self.subconjuntos)
+            if not self.finais.isdisjoint(subconjunto)
+        ]
+        return transicoes, finais, bool(self.mortas)
+
+
+def _redistribuir(parte: _Parte, num_partes: int) -> List[tuple]:
+    """
+    Divide o estado de uma parte única (num_partes=1, ids = posições) entre
+    `num_partes` partes, com os ids renumerados para a partição por hash.
+    """
+    estados: List[tuple] = [([], [], [], []) for _ in range(num_partes)]
+    novo_id: List[int] = []
+    for subconjunto in parte.subconjuntos:
+        dono = hash(subconjunto) % num_partes
+        lista = estados[dono][0]
+        novo_id.append(len(lista) * num_partes + dono)
+        lista.append(subconjunto)
+    for local in parte.fronteira:
+        i = novo_id[local]
+        estados[i % num_partes][1].append(i // num_partes)
+    for origem, simbolo, destino in parte.recebidas:
+        d = novo_id[destino]
+        estados[d % num_partes][2].append((novo_id[origem], simbolo, d))
+    for local, simbolo in parte.mortas:
+        i = novo_id[local]
+        estados[i % num_partes][3].append((i // num_partes, simbolo))
+    return estados
+
+
+class _ParteLocal:
+    """Executa uma `_Parte` no próprio processo."""
+
+    def __init__(self, parte: _Parte) -> None:
+        self.parte = parte
+        self.resultado = None
+
+    def enviar(self, metodo: str, argumentos: tuple) -> None:
+        self.resultado = getattr(self.parte, metodo)(*argumentos)
+
+    def receber(self):
+        return self.resultado
+
+    def encerrar(self) -> None:
+        pass
+
+
+def _trabalhador(conexao, args) -> None:
+    parte = _Parte(*args)
+    while True:
+        mensagem = conexao.recv()
+        if mensagem is None:
+            break
+        metodo, argumentos = mensagem
+        conexao.send(getattr(parte, metodo)(*argumentos))
+    conexao.close()
+
+
+class _ParteRemota:
+    """Uma `_Parte` num processo filho, comandada por um Pipe."""
+
+    def __init__(self, *args) -> None:
+        import multiprocessing
+        self.conexao, filho = multiprocessing.Pipe()
+        self.processo = multiprocessing.Process(target=_trabalhador, args=(filho, args), daemon=True)
+        self.processo.start()
+        filho.close()
+
+    def enviar(self, metodo: str, argumentos: tuple) -> None:
+        self.conexao.send((metodo, argumentos))
+
+    def receber(self):
+        return self.conexao.recv()
+
+    def encerrar(self) -> None:
+        try:
+            self.conexao.send(None)
+        except OSError:
+            pass
+        self.processo.join()
+
+
+def converter_afn_para_afd_paralelo(afn: Automato, processos: Optional[int] = None,
+                                    aparar: bool = False, fronteira_minima: int = 4096):
+    """
+    Mesma entrada e saída de `converter_afn_para_afd`, com a tabela de visitados
+    e a expansão dos estados divididas entre `processos` processos (padrão:
+    os.cpu_count()).
+
+    - processos=1: tudo roda no próprio processo
+    - aparar: remove antes os estados inacessíveis e mortos do AFN (ver aparar.py)
+    - fronteira_minima: a BFS só passa para os processos quando a fronteira de um
+      nível atinge esse tamanho; antes disso (e para AFDs pequenos) o custo de
+      criar processos e trocar mensagens não compensa
+    """
+    for mapa in afn.transicoes.values():
+        if EPSILON in mapa:
+            raise ValueError("AFN contém transições ε. Use a conversão AFN-ε → AFN antes (opção 1).")
+
+    if aparar:
+        from aparar import aparar_automato
+        afn, _ = aparar_automato(afn)
+
+    alfabeto = sorted(afn.alfabeto)
+    nomes = sorted(afn.estados)
+    indice = {n: i for i, n in enumerate(nomes)}
+    # tabela[estado][i] = destinos (ordenados) pelo i-ésimo símbolo do alfabeto
+    tabela: List[List[Subconjunto]] = [
+        [tuple(sorted(indice[d] for d in afn.transicoes.get(n, {}).get(s, ()))) for s in alfabeto]
+        for n in nomes
+    ]
+    finais = {indice[f] for f in afn.finais}
+
+    inicial: Subconjunto = tuple(sorted(indice[e] for e in afn.iniciais))
+    if not inicial:
+        return alfabeto, [DEAD], DEAD, [], {DEAD: {a: DEAD for a in alfabeto}}
+    nome_inicial = ",".join(nomes[e] for e in inicial)
+
+    num_partes = processos or os.cpu_count() or 1
+
+    # fase local: uma única parte, no próprio processo, enquanto a fronteira é pequena
+    local = _Parte(0, 1, tabela, alfabeto, nomes, finais)
+    local.registrar([pickle.dumps([(-1, 0, inicial)])])
+    while local.fronteira and (num_partes == 1 or len(local.fronteira) < fronteira_minima):
+        local.registrar(local.expandir())
+
+    partes = []
+    try:
+        if not local.fronteira or num_partes == 1:
+            partes.append(_ParteLocal(local))
+            num_partes = 1
+        else:
+            for p, estado in enumerate(_redistribuir(local, num_partes)):
+                partes.append(_ParteRemota(p, num_partes, tabela, alfabeto, nomes, finais, estado))
+            del local
+
+        def em_todas(metodo: str, argumentos_por_parte) -> list:
+            # envia a todas antes de esperar qualquer resposta: as partes trabalham juntas
+            for parte, argumentos in zip(partes, argumentos_por_parte):
+                parte.enviar(metodo, argumentos)
+            return [parte.receber() for parte in partes]
+
+        def transpor(baldes: List[List[bytes]]) -> List[tuple]:
+            # baldes[origem][destino] -> argumentos de cada destino
+            return [([b[destino] for b in baldes],) for destino in range(num_partes)]
+
+        novos = [1]
+        while sum(novos):
+            baldes = em_todas("expandir", [()] * num_partes)
+            novos = em_todas("registrar", transpor(baldes))
+
+        baldes = em_todas("enviar_transicoes", [()] * num_partes)
+        resultados = em_todas("montar", transpor(baldes))
+    finally:
+        for parte in partes:
+            parte.encerrar()
+
+    dfa_transicoes: Dict[str, Dict[str, str]] = {}
+    dfa_finais: List[str] = []
+    tem_estado_morto = False
+    for trecho, finais_parte, morto in resultados:
+        dfa_transicoes.update(trecho)
+        dfa_finais.extend(finais_parte)
+        tem_estado_morto = tem_estado_morto or morto
+
+    if tem_estado_morto:
+        dfa_transicoes[DEAD] = {a: DEAD for a in alfabeto}
+
+    return (
+        alfabeto,
+        sorted(dfa_transicoes),
+        nome_inicial,
+        sorted(dfa_finais),
+        dfa_transicoes,
+    )
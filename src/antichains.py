@@ -0,0 +1,121 @@
+from collections import deque
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+from testar_palavra import Automato, EPSILON
+from converterAFNEpAFN import FechosEpsilon
+from equivalencia import reconstruir_palavra
+
+
+# Universalidade e inclusão de AFN/AFN-ε sem determinização completa.
+#
+# Os subconjuntos do método dos subconjuntos são explorados sob demanda, em
+# largura, e podados por subsunção: se um subconjunto U já foi visitado e U ⊆ T,
+# qualquer palavra rejeitada a partir de T também é rejeitada a partir de U, então
+# T não precisa ser explorado. Só os elementos minimais (uma antichain) são mantidos.
+# Como a busca é em largura, U nunca está mais fundo que T e o contraexemplo
+# encontrado continua sendo de comprimento mínimo.
+
+
+class _Antichain:
+    """Conjuntos minimais (por inclusão) já visitados, agrupados por uma chave."""
+
+    __slots__ = ("elementos",)
+
+    def __init__(self) -> None:
+        self.elementos: Dict[object, List[FrozenSet[str]]] = {}
+
+    def subsumido(self, chave, conjunto: FrozenSet[str]) -> bool:
+        return any(u <= conjunto for u in self.elementos.get(chave, ()))
+
+    def adicionar(self, chave, conjunto: FrozenSet[str]) -> None:
+        # remove os conjuntos que passam a ser subsumidos pelo novo
+        lista = [v for v in self.elementos.get(chave, ()) if not conjunto <= v]
+        lista.append(conjunto)
+        self.elementos[chave] = lista
+
+
+def universal_afn(automato: Automato) -> Tuple[bool, Optional[str]]:
+    """
+    Verifica se o AFN/AFN-ε aceita todas as palavras sobre seu alfabeto.
+
+    Retorna (True, None) ou (False, palavra mais curta rejeitada).
+    """
+    fechos = FechosEpsilon(automato)
+    finais = automato.finais
+    alfabeto = sorted(automato.alfabeto - {EPSILON})
+
+    inicio = fechos.de_conjunto(automato.iniciais)
+    no_inicio = (None, inicio)
+    caminho: Dict[Tuple, Optional[Tuple[Tuple, str]]] = {no_inicio: None}
+    if finais.isdisjoint(inicio):
+        return False, ""
+
+    antichain = _Antichain()
+    antichain.adicionar(None, inicio)
+    fila: deque[Tuple] = deque([no_inicio])
+
+    while fila:
+        no = fila.popleft()
+        atual = no[1]
+        for simbolo in alfabeto:
+            proximo = fechos.post(atual, simbolo)
+            no_proximo = (None, proximo)
+            if finais.isdisjoint(proximo):
+                caminho[no_proximo] = (no, simbolo)
+                return False, reconstruir_palavra(caminho, no_proximo)
+            if antichain.subsumido(None, proximo):
+                continue
+            antichain.adicionar(None, proximo)
+            caminho[no_proximo] = (no, simbolo)
+            fila.append(no_proximo)
+
+    return True, None
+
+
+def incluso_afn(a: Automato, b: Automato) -> Tuple[bool, Optional[str]]:
+    """
+    Verifica se L(a) ⊆ L(b) para AFN/AFN-ε.
+
+    Explora pares (estado de a, subconjunto de b); o par (p, S) é subsumido por
+    (p, S') quando S' ⊆ S. Um contraexemplo é um par com p final em a e S sem
+    finais de b.
+
+    Retorna (True, None) ou (False, palavra mais curta aceita por a e rejeitada por b).
+    """
+    fechos_a, fechos_b = FechosEpsilon(a), FechosEpsilon(b)
+    alfabeto = sorted(a.alfabeto - {EPSILON})
+
+    inicio_b = fechos_b.de_conjunto(b.iniciais)
+    caminho: Dict[Tuple, Optional[Tuple[Tuple, str]]] = {}
+    antichain = _Antichain()
+    fila: deque[Tuple] = deque()
+
+    for p in sorted(fechos_a.de_conjunto(a.iniciais)):
+        no = (p, inicio_b)
+        caminho[no] = None
+        if p in a.finais and b.finais.isdisjoint(inicio_b):
+            return False, ""
+        if not antichain.subsumido(p, inicio_b):
+            antichain.adicionar(p, inicio_b)
+            fila.append(no)
+
+    while fila:
+        no = fila.popleft()
+        p, conjunto = no
+        for simbolo in alfabeto:
+            destinos_a = a.transicoes.get(p, {}).get(simbolo)
+            if not destinos_a:
+                continue
+            proximo_b = fechos_b.post(conjunto, simbolo)
+            for p2 in sorted(fechos_a.de_conjunto(destinos_a)):
+                no_proximo = (p2, proximo_b)
+                if p2 in a.finais and b.finais.isdisjoint(proximo_b):
+                    caminho[no_proximo] = (no, simbolo)
+                    return False, reconstruir_palavra(caminho, no_proximo)
+                if antichain.subsumido(p2, proximo_b):
+                    continue
+                antichain.adicionar(p2, proximo_b)
+                caminho[no_proximo] = (no, simbolo)
+                fila.append(no_proximo)
+
+    return True, None
@@ -0,0 +1,144 @@
+from collections import deque
+from typing import Dict, Iterable, List, Set, Tuple
+
+from testar_palavra import Automato
+
+
+# Poda (trim) de autômatos: remove estados inacessíveis (não alcançáveis a partir
+# dos iniciais) e estados mortos (dos quais nenhum final é alcançável). A linguagem
+# reconhecida não muda, e as etapas caras (remoção de ε, subconjuntos, Hopcroft)
+# passam a trabalhar só com os estados úteis.
+
+
+def alcancaveis(inicio: Iterable[str], vizinhos: Dict[str, Set[str]]) -> Set[str]:
+    """Estados alcançáveis a partir de `inicio` seguindo `vizinhos` (BFS), incluindo os iniciais."""
+    vistos: Set[str] = set(inicio)
+    fila: deque[str] = deque(vistos)
+    while fila:
+        atual = fila.popleft()
+        for d in vizinhos.get(atual, ()):
+            if d not in vistos:
+                vistos.add(d)
+                fila.append(d)
+    return vistos
+
+
+def _estatisticas(estados_antes: int, transicoes_antes: int, acessiveis: Set[str],
+                  uteis: Set[str], estados_depois: int, transicoes_depois: int) -> Dict[str, int]:
+    return {
+        "estados_antes": estados_antes,
+        "estados_depois": estados_depois,
+        "inacessiveis": estados_antes - len(acessiveis),
+        "mortos": len(acessiveis) - len(uteis),
+        "transicoes_antes": transicoes_antes,
+        "transicoes_depois": transicoes_depois,
+    }
+
+
+def aparar_automato(automato: Automato) -> Tuple[Automato, Dict[str, int]]:
+    """
+    Poda um AFN/AFN-ε (as ε-transições contam como arestas comuns).
+
+    Faz uma BFS para frente a partir dos iniciais e uma BFS para trás, a partir
+    dos finais, sobre o índice inverso das transições. Retorna o novo autômato e
+    um dict de estatísticas (estados/transições antes e depois, inacessíveis, mortos).
+    """
+    sucessores: Dict[str, Set[str]] = {}
+    predecessores: Dict[str, Set[str]] = {}
+    transicoes_antes = 0
+    for o, mapa in automato.transicoes.items():
+        for destinos in mapa.values():
+            transicoes_antes += len(destinos)
+            sucessores.setdefault(o, set()).update(destinos)
+            for d in destinos:
+                predecessores.setdefault(d, set()).add(o)
+
+    acessiveis = alcancaveis(automato.iniciais, sucessores)
+    uteis = acessiveis & alcancaveis(automato.finais & acessiveis, predecessores)
+
+    transicoes: Dict[str, Dict[str, Set[str]]] = {}
+    transicoes_depois = 0
+    for o in uteis:
+        for simbolo, destinos in automato.transicoes.get(o, {}).items():
+            ds = destinos & uteis
+            if ds:
+                transicoes.setdefault(o, {})[simbolo] = ds
+                transicoes_depois += len(ds)
+
+    novo = Automato(
+        uteis,
+        automato.alfabeto,
+        automato.iniciais & uteis,
+        automato.finais & uteis,
+        transicoes,
+    )
+    return novo, _estatisticas(len(automato.estados), transicoes_antes, acessiveis,
+                               uteis, len(uteis), transicoes_depois)
+
+
+def aparar_afd(alfabeto: List[str], estados: List[str], inicial: str,
+               finais: List[str], transicoes: Dict[str, Dict[str, str]]):
+    """
+    Poda um AFD no formato (alfabeto, estados, inicial, finais, transicoes).
+
+    As transições para estados mortos passam a ir para um único estado
+    sumidouro (criado só se necessário), de modo que o AFD resultante continua
+    completo — a minimização de Hopcroft depende disso. Retorna
+    ((alfabeto, estados, inicial, finais, transicoes), estatisticas).
+    """
+    if inicial not in estados:
+        raise ValueError(f"Estado inicial '{inicial}' não está na lista de estados")
+
+    sucessores: Dict[str, Set[str]] = {}
+    predecessores: Dict[str, Set[str]] = {}
+    transicoes_antes = 0
+    for o, mapa in transicoes.items():
+        for d in mapa.values():
+            transicoes_antes += 1
+            sucessores.setdefault(o, set()).add(d)
+            predecessores.setdefault(d, set()).add(o)
+
+    acessiveis = alcancaveis([inicial], sucessores)
+    finais_set = set(finais)
+    uteis = acessiveis & alcancaveis(finais_set & acessiveis, predecessores)
+
+    morto = "∅"
+    while morto in uteis:
+        morto += "'"
+
+    novas_transicoes: Dict[str, Dict[str, str]] = {}
+    usa_morto = inicial not in uteis
+    for o in uteis:
+        novas_transicoes[o] = {}
+        for simbolo in alfabeto:
+            d = transicoes.get(o, {}).get(simbolo)
+            if d in uteis:
+                novas_transicoes[o][simbolo] = d
+            else:
+                novas_transicoes[o][simbolo] = morto
+                usa_morto = True
+
+    novos_estados = set(uteis)
+    if usa_morto:
+        novos_estados.add(morto)
+        novas_transicoes[morto] = {simbolo: morto for simbolo in alfabeto}
+
+    novo_inicial = inicial if inicial in uteis else morto
+    transicoes_depois = sum(len(m) for m in novas_transicoes.values())
+    afd = (
+        alfabeto,
+        sorted(novos_estados),
+        novo_inicial,
+        sorted(finais_set & uteis),
+        novas_transicoes,
+    )
+    return afd, _estatisticas(len(estados), transicoes_antes, acessiveis,
+                              uteis, len(novos_estados), transicoes_depois)
+
+
+def resumo_poda(estatisticas: Dict[str, int]) -> str:
+    return (
+        f"Poda: {estatisticas['estados_antes']} → {estatisticas['estados_depois']} estado(s) "
+        f"({estatisticas['inacessiveis']} inacessível(is), {estatisticas['mortos']} morto(s)); "
+        f"transições {estatisticas['transicoes_antes']} → {estatisticas['transicoes_depois']}"
+    )
@@ -0,0 +1,209 @@
+import sys
+from array import array
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple, Union
+
+from testar_palavra import Automato, EPSILON, _ler_json
+
+
+# Destinos de (estado, simbolo): um int quando há um único destino (caso mais
+# comum em autômatos quase determinísticos) ou um array('i') ordenado quando há vários.
+Destinos = Union[int, array]
+
+
+class AutomatoCompacto:
+    """
+    Representação compacta de um AFN/AFN-ε, pensada para autômatos grandes.
+
+    - nomes: lista com o nome de cada estado (o índice é o id do estado)
+    - indices: dict nome -> id
+    - alfabeto: frozenset de símbolos
+    - iniciais / finais: frozenset de ids
+    - transicoes: lista indexada pelo id de origem com None (sem transições) ou
+      dict { simbolo: destino } onde destino é um int ou um array('i') de ids.
+
+    Em relação a `Automato` (dict de dict de set de strings), evita um set por
+    par (estado, símbolo) e guarda estados como inteiros.
+    """
+
+    __slots__ = ("nomes", "indices", "alfabeto", "iniciais", "finais", "transicoes")
+
+    def __init__(
+        self,
+        nomes: List[str],
+        alfabeto: Iterable[str],
+        iniciais: Iterable[int],
+        finais: Iterable[int],
+        transicoes: List[Optional[Dict[str, Destinos]]],
+    ) -> None:
+        self.nomes: List[str] = nomes
+        self.indices: Dict[str, int] = {n: i for i, n in enumerate(nomes)}
+        self.alfabeto: FrozenSet[str] = frozenset(alfabeto)
+        self.iniciais: FrozenSet[int] = frozenset(iniciais)
+        self.finais: FrozenSet[int] = frozenset(finais)
+        self.transicoes: List[Optional[Dict[str, Destinos]]] = transicoes
+
+    # ------------------------- Carregadores ------------------------- #
+    @staticmethod
+    def from_json(path: str) -> "AutomatoCompacto":
+        """Carrega do mesmo formato JSON aceito por `Automato.from_json`."""
+        estados, alfabeto, iniciais, finais, triplas = _ler_json(path)
+        return AutomatoCompacto.from_triplas(estados, alfabeto, iniciais, finais, triplas)
+
+    @staticmethod
+    def from_triplas(
+        estados: Iterable[str],
+        alfabeto: Iterable[str],
+        iniciais: Iterable[str],
+        finais: Iterable[str],
+        triplas: Iterable[Tuple[str, str, str]],
+    ) -> "AutomatoCompacto":
+        """
+        Constrói a partir de transições (origem, destino, simbolo), validando
+        estados e símbolos como `Automato._validar`.
+        """
+        nomes: List[str] = []
+        indices: Dict[str, int] = {}
+        for e in estados:
+            if e not in indices:
+                indices[e] = len(nomes)
+                nomes.append(e)
+
+        simbolos = {s: sys.intern(s) for s in alfabeto}
+        alfabeto_interno = list(simbolos.values())
+        simbolos[EPSILON] = EPSILON
+
+        def _id(nome: str, contexto: str) -> int:
+            try:
+                return indices[nome]
+            except KeyError:
+                raise ValueError(f"Estado inválido em {contexto}: {nome}") from None
+
+        ids_iniciais = [_id(e, "iniciais/finais") for e in iniciais]
+        ids_finais = [_id(e, "iniciais/finais") for e in finais]
+
+        transicoes: List[Optional[Dict[str, Destinos]]] = [None] * len(nomes)
+        for origem, destino, simbolo in triplas:
+            o = _id(origem, "origem das transições")
+            d = _id(destino, "destino das transições")
+            s = simbolos.get(simbolo)
+            if s is None:
+                raise ValueError(f"Símbolo inválido em transição: {simbolo}")
+
+            mapa = transicoes[o]
+            if mapa is None:
+                mapa = transicoes[o] = {}
+            atual = mapa.get(s)
+            if atual is None:
+                mapa[s] = d
+            elif isinstance(atual, int):
+                if atual != d:
+                    mapa[s] = array("i", (atual, d))
+            else:
+                atual.append(d)
+
+        # remove duplicatas dos destinos múltiplos e mantém-nos ordenados
+        for mapa in transicoes:
+            if mapa is None:
+                continue
+            for s, ds in mapa.items():
+                if not isinstance(ds, int):
+                    unicos = sorted(set(ds))
+                    mapa[s] = unicos[0] if len(unicos) == 1 else array("i", unicos)
+
+        return AutomatoCompacto(nomes, alfabeto_interno, ids_iniciais, ids_finais, transicoes)
+
+    @staticmethod
+    def from_automato(automato: Automato) -> "AutomatoCompacto":
+        triplas = (
+            (o, d, s)
+            for o, mapa in automato.transicoes.items()
+            for s, ds in mapa.items()
+            for d in ds
+        )
+        return AutomatoCompacto.from_triplas(
+            sorted(automato.estados), automato.alfabeto, automato.iniciais, automato.finais, triplas
+        )
+
+    def to_automato(self) -> Automato:
+        transicoes: Dict[str, Dict[str, Set[str]]] = {}
+        for o, mapa in enumerate(self.transicoes):
+            if mapa is None:
+                continue
+            transicoes[self.nomes[o]] = {
+                s: {self.nomes[d] for d in _iterar(ds)} for s, ds in mapa.items()
+            }
+        return Automato(
+            self.nomes,
+            self.alfabeto,
+            (self.nomes[i] for i in self.iniciais),
+            (self.nomes[i] for i in self.finais),
+            transicoes,
+        )
+
+    # ------------------------- Consultas ------------------------- #
+    def destinos(self, estado: int, simbolo: str) -> Tuple[int, ...]:
+        mapa = self.transicoes[estado]
+        if mapa is None:
+            return ()
+        ds = mapa.get(simbolo)
+        if ds is None:
+            return ()
+        return (ds,) if isinstance(ds, int) else tuple(ds)
+
+    def num_transicoes(self) -> int:
+        total = 0
+        for mapa in self.transicoes:
+            if mapa is None:
+                continue
+            for ds in mapa.values():
+                total += 1 if isinstance(ds, int) else len(ds)
+        return total
+
+    # ------------------------- Execução ------------------------- #
+    def _fecho_epsilon(self, estados: Iterable[int]) -> Set[int]:
+        fecho: Set[int] = set(estados)
+        pilha: List[int] = list(fecho)
+        transicoes = self.transicoes
+        while pilha:
+            mapa = transicoes[pilha.pop()]
+            if mapa is None:
+                continue
+            ds = mapa.get(EPSILON)
+            if ds is None:
+                continue
+            for d in _iterar(ds):
+                if d not in fecho:
+                    fecho.add(d)
+                    pilha.append(d)
+        return fecho
+
+    def aceita(self, palavra: str, rejeitar_simbolo_fora_alfabeto: bool = True) -> bool:
+        """Mesma semântica de `Automato.aceita`."""
+        if any(c not in self.alfabeto for c in palavra):
+            if rejeitar_simbolo_fora_alfabeto:
+                return False
+
+        transicoes = self.transicoes
+        atuais = self._fecho_epsilon(self.iniciais)
+        for c in palavra:
+            move: Set[int] = set()
+            for e in atuais:
+                mapa = transicoes[e]
+                if mapa is None:
+                    continue
+                ds = mapa.get(c)
+                if ds is None:
+                    continue
+                if isinstance(ds, int):
+                    move.add(ds)
+                else:
+                    move.update(ds)
+            atuais = self._fecho_epsilon(move)
+            if not atuais:
+                break
+
+        return not self.finais.isdisjoint(atuais)
+
+
+def _iterar(ds: Destinos) -> Iterable[int]:
+    return (ds,) if isinstance(ds, int) else ds
@@ -0,0 +1,269 @@
+import hashlib
+import json
+import os
+import tempfile
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from testar_palavra import Automato
+
+
+# Cache em disco, endereçado por conteúdo, para os resultados das conversões.
+#
+# A chave é o SHA-256 de uma forma canônica do autômato de entrada (listas
+# ordenadas, independente da ordem do JSON) junto com o nome da operação e seus
+# parâmetros e a versão do formato. Cada resultado fica num arquivo JSON próprio
+# (nunca pickle: o diretório pode ser compartilhado, e carregar um pickle executa
+# código), gravado de forma atômica (arquivo temporário + os.replace), então
+# vários processos podem usar o mesmo diretório ao mesmo tempo. O tamanho total é
+# limitado com remoção LRU pela data de modificação, que é atualizada a cada acerto.
+#
+# O cache é opcional: erros de E/S (diretório sem permissão, disco cheio...) só
+# são contados, e a operação segue com o valor calculado.
+
+LIMITE_PADRAO = 256 * 1024 * 1024
+
+# faz parte da chave: incrementar quando mudar o formato gravado ou o resultado
+# de alguma operação, para não reaproveitar entradas antigas
+VERSAO_FORMATO = 2
+
+
+def _forma_canonica(entrada) -> Any:
+    if isinstance(entrada, Automato):
+        return {
+            "alfabeto": sorted(entrada.alfabeto),
+            "estados": sorted(entrada.estados),
+            "iniciais": sorted(entrada.iniciais),
+            "finais": sorted(entrada.finais),
+            "transicoes": sorted(
+                [o, s, d]
+                for o, mapa in entrada.transicoes.items()
+                for s, ds in mapa.items()
+                for d in ds
+            ),
+        }
+    # AFD no formato (alfabeto, estados, inicial, finais, transicoes). O alfabeto
+    # fica na ordem dada, pois os resultados (ex.: minimizar_afd) a preservam.
+    alfabeto, estados, inicial, finais, transicoes = entrada
+    return {
+        "alfabeto": list(alfabeto),
+        "estados": sorted(estados),
+        "inicial": inicial,
+        "finais": sorted(finais),
+        "transicoes": sorted([o, s, d] for o, mapa in transicoes.items() for s, d in mapa.items()),
+    }
+
+
+def chave_resultado(operacao: str, entrada, **parametros) -> str:
+    """Hash canônico de (versão do formato, operação, entrada, parâmetros)."""
+    dados = {
+        "versao": VERSAO_FORMATO,
+        "operacao": operacao,
+        "entrada": _forma_canonica(entrada),
+        "parametros": parametros,
+    }
+    texto = json.dumps(dados, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(texto.encode("utf-8")).hexdigest()
+
+
+def _codificar(valor) -> Any:
+    # os resultados das operações são Automato ou AFD em tupla; ambos viram JSON
+    if isinstance(valor, Automato):
+        return {"automato": _forma_canonica(valor)}
+    if isinstance(valor, tuple) and len(valor) == 5:
+        alfabeto, estados, inicial, finais, transicoes = valor
+        return {"afd": [list(alfabeto), list(estados), inicial, list(finais), transicoes]}
+    return {"valor": valor}
+
+
+def _decodificar(dados) -> Any:
+    if "automato" in dados:
+        a = dados["automato"]
+        transicoes: Dict[str, Dict[str, set]] = {}
+        for o, s, d in a["transicoes"]:
+            transicoes.setdefault(o, {}).setdefault(s, set()).add(d)
+        return Automato(a["estados"], a["alfabeto"], a["iniciais"], a["finais"], transicoes)
+    if "afd" in dados:
+        return tuple(dados["afd"])
+    return dados["valor"]
+
+
+class CacheResultados:
+    """
+    Cache persistente de resultados.
+
+    - diretorio: onde os arquivos ficam (padrão: $PLR_CACHE_DIR ou
+      ~/.cache/pratica_linguagem_regulares)
+    - limite_bytes: tamanho máximo total antes da remoção dos menos usados
+    """
+
+    def __init__(self, diretorio: Optional[str] = None, limite_bytes: int = LIMITE_PADRAO) -> None:
+        if diretorio is None:
+            diretorio = os.environ.get("PLR_CACHE_DIR") or os.path.join(
+                os.path.expanduser("~"), ".cache", "pratica_linguagem_regulares"
+            )
+        self.diretorio = diretorio
+        self.limite_bytes = limite_bytes
+        self.acertos = 0
+        self.falhas = 0
+        self.gravacoes = 0
+        self.removidos = 0
+        self.erros = 0  # falhas de E/S ignoradas
+        self._tamanho: Optional[int] = None  # estimativa do tamanho total em disco
+
+    def _caminho(self, chave: str) -> str:
+        return os.path.join(self.diretorio, chave[:2], chave + ".json")
+
+    def obter(self, chave: str) -> Tuple[bool, Any]:
+        """Retorna (True, valor) em caso de acerto ou (False, None)."""
+        caminho = self._caminho(chave)
+        try:
+            with open(caminho, "r", encoding="utf-8") as f:
+                valor = _decodificar(json.load(f))
+        except FileNotFoundError:
+            self.falhas += 1
+            return False, None
+        except OSError:
+            self.erros += 1
+            self.falhas += 1
+            return False, None
+        except (ValueError, KeyError, TypeError):
+            # arquivo corrompido: descarta
+            self._remover(caminho)
+            self.falhas += 1
+            return False, None
+
+        try:
+            os.utime(caminho)  # marca como usado recentemente (LRU)
+        except OSError:
+            pass
+        self.acertos += 1
+        return True, valor
+
+    def guardar(self, chave: str, valor: Any) -> bool:
+        """Grava `valor`; retorna False (e conta em `erros`) se a gravação falhar."""
+        caminho = self._caminho(chave)
+        pasta = os.path.dirname(caminho)
+        texto = json.dumps(_codificar(valor), ensure_ascii=False, separators=(",", ":"))
+
+        temporario = None
+        try:
+            os.makedirs(pasta, exist_ok=True)
+            fd, temporario = tempfile.mkstemp(dir=pasta, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(texto)
+            os.replace(temporario, caminho)
+            self.gravacoes += 1
+
+            if self._tamanho is not None:
+                self._tamanho += os.path.getsize(caminho)
+            if self._tamanho is None or self._tamanho > self.limite_bytes:
+                self._aplicar_limite()
+        except OSError:
+            if temporario is not None:
+                self._remover(temporario)
+            self.erros += 1
+            return False
+        return True
+
+    def memoizar(self, operacao: str, entrada, calcular: Callable[[], Any], **parametros) -> Any:
+        """Retorna o resultado em cache de `operacao` ou o calcula e guarda."""
+        chave = chave_resultado(operacao, entrada, **parametros)
+        achou, valor = self.obter(chave)
+        if achou:
+            return valor
+        valor = calcular()
+        self.guardar(chave, valor)
+        return valor
+
+    def _arquivos(self):
+        for raiz, _, nomes in os.walk(self.diretorio):
+            for nome in nomes:
+                if not nome.endswith(".json"):
+                    continue
+                caminho = os.path.join(raiz, nome)
+                try:
+                    st = os.stat(caminho)
+                except FileNotFoundError:
+                    continue  # removido por outro processo
+                yield st.st_mtime, st.st_size, caminho
+
+    def _aplicar_limite(self) -> None:
+        arquivos = sorted(self._arquivos())
+        total = sum(tamanho for _, tamanho, _ in arquivos)
+        for _, tamanho, caminho in arquivos:
+            if total <= self.limite_bytes:
+                break
+            if self._remover(caminho):
+                self.removidos += 1
+            total -= tamanho
+        self._tamanho = total
+
+    @staticmethod
+    def _remover(caminho: str) -> bool:
+        try:
+            os.remove(caminho)
+            return True
+        except OSError:
+            return False
+
+    def limpar(self) -> None:
+        for _, _, caminho in list(self._arquivos()):
+            self._remover(caminho)
+        self._tamanho = 0
+
+    def estatisticas(self) -> Dict[str, int]:
+        if self._tamanho is None:
+            self._tamanho = sum(tamanho for _, tamanho, _ in self._arquivos())
+        return {
+            "acertos": self.acertos,
+            "falhas": self.falhas,
+            "gravacoes": self.gravacoes,
+            "removidos": self.removidos,
+            "erros": self.erros,
+            "bytes_em_disco": self._tamanho,
+        }
+
+
+_cache_padrao: Optional[CacheResultados] = None
+
+
+def cache_padrao() -> CacheResultados:
+    global _cache_padrao
+    if _cache_padrao is None:
+        _cache_padrao = CacheResultados()
+    return _cache_padrao
+
+
+# ------------------------- Operações com cache ------------------------- #
+def remover_epsilon_cache(automato: Automato, aparar: bool = False,
+                          cache: Optional[CacheResultados] = None) -> Automato:
+    from converterAFNEpAFN import remover_epsilon
+
+    cache = cache or cache_padrao()
+    return cache.memoizar("remover_epsilon", automato,
+                          lambda: remover_epsilon(automato, aparar=aparar), aparar=aparar)
+
+
+def converter_afn_para_afd_cache(afn: Automato, aparar: bool = False, por_classes: bool = False,
+                                 cache: Optional[CacheResultados] = None):
+    from converterAFNparaAFD import converter_afn_para_afd
+
+    cache = cache or cache_padrao()
+    return cache.memoizar(
+        "converter_afn_para_afd", afn,
+        lambda: converter_afn_para_afd(afn, aparar=aparar, por_classes=por_classes),
+        aparar=aparar, por_classes=por_classes,
+    )
+
+
+def minimizar_afd_cache(alfabeto, estados, inicial, finais, transicoes, aparar: bool = False,
+                        por_classes: bool = False, cache: Optional[CacheResultados] = None):
+    from converter_minimizar_afd import minimizar_afd
+
+    cache = cache or cache_padrao()
+    afd = (alfabeto, estados, inicial, finais, transicoes)
+    return cache.memoizar(
+        "minimizar_afd", afd,
+        lambda: minimizar_afd(*afd, aparar=aparar, por_classes=por_classes),
+        aparar=aparar, por_classes=por_classes,
+    )
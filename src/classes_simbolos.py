@@ -0,0 +1,125 @@
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from testar_palavra import Automato, EPSILON
+
+
+# Compressão do alfabeto em classes de símbolos: dois símbolos ficam na mesma
+# classe quando levam cada estado exatamente aos mesmos destinos (como as "byte
+# classes" de motores de expressões regulares). Os algoritmos passam a iterar
+# sobre um representante por classe, e o resultado é expandido no final.
+#
+# As classes são representadas por dois dicts:
+#   - classe_de: simbolo -> representante da classe (o menor símbolo dela)
+#   - membros: representante -> lista ordenada de símbolos da classe
+
+
+def _agrupar(alfabeto: Iterable[str],
+             assinaturas: Dict[str, Set[Tuple]]) -> Tuple[Dict[str, str], Dict[str, List[str]]]:
+    por_assinatura: Dict[FrozenSet[Tuple], List[str]] = {}
+    for simbolo in sorted(set(alfabeto)):
+        chave = frozenset(assinaturas.get(simbolo, ()))
+        por_assinatura.setdefault(chave, []).append(simbolo)
+
+    classe_de: Dict[str, str] = {}
+    membros: Dict[str, List[str]] = {}
+    for grupo in por_assinatura.values():
+        representante = grupo[0]
+        membros[representante] = grupo
+        for simbolo in grupo:
+            classe_de[simbolo] = representante
+    return classe_de, membros
+
+
+def classes_automato(automato: Automato) -> Tuple[Dict[str, str], Dict[str, List[str]]]:
+    """
+    Calcula as classes de símbolos de um AFN/AFN-ε em tempo proporcional ao
+    número de transições. ε nunca é agrupado com outros símbolos.
+    """
+    assinaturas: Dict[str, Set[Tuple]] = {}
+    for origem, mapa in automato.transicoes.items():
+        for simbolo, destinos in mapa.items():
+            if simbolo != EPSILON and destinos:
+                assinaturas.setdefault(simbolo, set()).add((origem, frozenset(destinos)))
+    return _agrupar(automato.alfabeto - {EPSILON}, assinaturas)
+
+
+def classes_afd(alfabeto: List[str], transicoes: Dict[str, Dict[str, str]]) -> Tuple[Dict[str, str], Dict[str, List[str]]]:
+    """Calcula as classes de símbolos de um AFD (tabela {estado: {simbolo: destino}})."""
+    assinaturas: Dict[str, Set[Tuple]] = {}
+    for origem, mapa in transicoes.items():
+        for simbolo, destino in mapa.items():
+            if destino:
+                assinaturas.setdefault(simbolo, set()).add((origem, destino))
+    return _agrupar(alfabeto, assinaturas)
+
+
+def comprimir_automato(automato: Automato) -> Tuple[Automato, Dict[str, List[str]]]:
+    """
+    Retorna (autômato sobre os representantes das classes, membros). Transições
+    ε são mantidas; se ε está no alfabeto, fica numa classe só sua em `membros`,
+    para que `expandir_afd` a reconstrua como no caminho sem compressão.
+    """
+    _, membros = classes_automato(automato)
+    transicoes: Dict[str, Dict[str, Set[str]]] = {}
+    for origem, mapa in automato.transicoes.items():
+        novo = {s: ds for s, ds in mapa.items() if s == EPSILON or s in membros}
+        if novo:
+            transicoes[origem] = novo
+    if EPSILON in automato.alfabeto:
+        membros[EPSILON] = [EPSILON]
+    alfabeto = set(membros)
+    comprimido = Automato(automato.estados, alfabeto, automato.iniciais, automato.finais, transicoes)
+    return comprimido, membros
+
+
+def comprimir_afd(alfabeto: List[str], estados: List[str], inicial: str,
+                  finais: List[str], transicoes: Dict[str, Dict[str, str]]):
+    """Retorna ((alfabeto, estados, inicial, finais, transicoes) sobre representantes, membros)."""
+    _, membros = classes_afd(alfabeto, transicoes)
+    novas_transicoes = {
+        origem: {s: d for s, d in mapa.items() if s in membros}
+        for origem, mapa in transicoes.items()
+    }
+    return (sorted(membros), estados, inicial, finais, novas_transicoes), membros
+
+
+def expandir_afd(afd, membros: Dict[str, List[str]], alfabeto_original: Optional[List[str]] = None):
+    """
+    Desfaz a compressão: cada transição por um representante vale para toda a
+    classe. O alfabeto volta na ordem de `alfabeto_original` (ordenado, se omitido).
+    """
+    alfabeto, estados, inicial, finais, transicoes = afd
+    novas_transicoes: Dict[str, Dict[str, str]] = {}
+    for origem, mapa in transicoes.items():
+        novas_transicoes[origem] = {}
+        for representante, destino in mapa.items():
+            for simbolo in membros[representante]:
+                novas_transicoes[origem][simbolo] = destino
+    simbolos = {s for r in alfabeto for s in membros[r]}
+    if alfabeto_original is None:
+        novo_alfabeto = sorted(simbolos)
+    else:
+        novo_alfabeto = [s for s in alfabeto_original if s in simbolos]
+    return (novo_alfabeto, estados, inicial, finais, novas_transicoes)
+
+
+def tabela_classes(membros: Dict[str, List[str]]) -> Dict[str, str]:
+    """Monta a tabela símbolo → representante a partir de `membros`."""
+    return {simbolo: representante for representante, grupo in membros.items() for simbolo in grupo}
+
+
+def aceita_afd_por_classes(afd, classe_de: Dict[str, str], palavra: str) -> bool:
+    """
+    Simula um AFD comprimido usando a tabela símbolo → classe. Símbolos fora do
+    alfabeto e transições ausentes rejeitam a palavra.
+    """
+    _, _, inicial, finais, transicoes = afd
+    estado: Optional[str] = inicial
+    for c in palavra:
+        representante = classe_de.get(c)
+        if representante is None:
+            return False
+        estado = transicoes.get(estado, {}).get(representante)
+        if estado is None:
+            return False
+    return estado in finais
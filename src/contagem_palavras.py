@@ -0,0 +1,174 @@
+import random
+from typing import Dict, List, Optional
+
+
+# Contagem das palavras aceitas por um AFD e amostragem uniforme entre elas,
+# por programação dinâmica sobre a tabela de transições.
+#
+# c_k[q] = número de palavras de comprimento k aceitas a partir do estado q
+#   c_0[q] = 1 se q é final, senão 0
+#   c_k[q] = soma, para cada símbolo a, de c_{k-1}[δ(q, a)]
+# O número de palavras aceitas de comprimento k é c_k[inicial].
+#
+# Com NumPy disponível (dependência opcional), cada passo é uma indexação
+# vetorizada da tabela; sem módulo as contagens são inteiros Python exatos
+# (dtype=object), com módulo ficam em int64.
+
+
+def _tabela(alfabeto: List[str], estados: List[str], transicoes: Dict[str, Dict[str, str]]):
+    # tabela[i][j] = índice do destino do estado i pelo símbolo j; a linha
+    # len(estados) é um sumidouro para as transições ausentes (AFD parcial)
+    indice = {e: i for i, e in enumerate(estados)}
+    sumidouro = len(estados)
+    tabela = [
+        [indice.get(transicoes.get(e, {}).get(s), sumidouro) for s in alfabeto]
+        for e in estados
+    ]
+    tabela.append([sumidouro] * len(alfabeto))
+    return tabela, indice
+
+
+def _contagens(alfabeto, estados, finais, transicoes, n: int, modulo: Optional[int]):
+    """Retorna ([c_0, ..., c_n], indice), com cada c_k indexável por estado."""
+    tabela, indice = _tabela(alfabeto, estados, transicoes)
+    finais_set = set(finais)
+    inicial_c = [1 if e in finais_set else 0 for e in estados] + [0]
+
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+
+    if np is not None and alfabeto:
+        if modulo is not None and modulo * len(alfabeto) >= 2 ** 63:
+            raise ValueError("Módulo grande demais para contagem em int64")
+        t = np.array(tabela, dtype=np.int64)
+        c = np.array(inicial_c, dtype=object if modulo is None else np.int64)
+        contagens = [c]
+        for _ in range(n):
+            c = c[t].sum(axis=1)
+            if modulo is not None:
+                c %= modulo
+            contagens.append(c)
+        return contagens, indice
+
+    c = inicial_c
+    contagens = [c]
+    for _ in range(n):
+        anterior = c
+        c = [sum(anterior[d] for d in linha) for linha in tabela]
+        if modulo is not None:
+            c = [x % modulo for x in c]
+        contagens.append(c)
+    return contagens, indice
+
+
+def contar_palavras(alfabeto: List[str], estados: List[str], inicial: str,
+                    finais: List[str], transicoes: Dict[str, Dict[str, str]],
+                    n: int, modulo: Optional[int] = None) -> List[int]:
+    """
+    Número de palavras aceitas de cada comprimento 0..n (lista com n+1 valores).
+    Sem `modulo` os valores são exatos (inteiros de precisão arbitrária); com
+    `modulo` são calculados módulo esse número.
+    """
+    contagens, indice = _contagens(alfabeto, estados, finais, transicoes, n, modulo)
+    i = indice[inicial]
+    return [int(c[i]) for c in contagens]
+
+
+def amostrar_palavras(alfabeto: List[str], estados: List[str], inicial: str,
+                      finais: List[str], transicoes: Dict[str, Dict[str, str]],
+                      comprimento: int, quantidade: int, exato: bool = True,
+                      semente: Optional[int] = None) -> List[str]:
+    """
+    Sorteia `quantidade` palavras aceitas, uniformemente (com reposição):
+    - exato=True: entre as palavras de comprimento exatamente `comprimento`
+    - exato=False: entre todas as palavras de comprimento 0..`comprimento`
+
+    Cada símbolo é escolhido com probabilidade proporcional ao número de
+    complementos aceitos a partir do estado seguinte, o que dá distribuição
+    uniforme sem rejeição.
+    """
+    contagens, indice = _contagens(alfabeto, estados, finais, transicoes, comprimento, None)
+    i0 = indice[inicial]
+    totais = [int(c[i0]) for c in contagens]
+
+    rng = random.Random(semente)
+    if exato:
+        if totais[comprimento] == 0:
+            raise ValueError(f"Nenhuma palavra aceita de comprimento {comprimento}")
+        comprimentos = [comprimento] * quantidade
+    else:
+        if sum(totais) == 0:
+            raise ValueError(f"Nenhuma palavra aceita de comprimento até {comprimento}")
+        comprimentos = _sortear_comprimentos(totais, quantidade, rng)
+
+    tabela, _ = _tabela(alfabeto, estados, transicoes)
+    por_comprimento: Dict[int, int] = {}
+    for k in comprimentos:
+        por_comprimento[k] = por_comprimento.get(k, 0) + 1
+
+    palavras: List[str] = []
+    for k, qtd in sorted(por_comprimento.items()):
+        palavras.extend(_amostrar(alfabeto, tabela, contagens, i0, k, qtd, rng))
+    if len(por_comprimento) > 1:
+        rng.shuffle(palavras)
+    return palavras
+
+
+def _sortear_comprimentos(totais: List[int], quantidade: int, rng: random.Random) -> List[int]:
+    acumulado: List[int] = []
+    soma = 0
+    for t in totais:
+        soma += t
+        acumulado.append(soma)
+    from bisect import bisect_right
+    return [bisect_right(acumulado, rng.randrange(soma)) for _ in range(quantidade)]
+
+
+def _amostrar(alfabeto, tabela, contagens, i0: int, k: int, quantidade: int,
+              rng: random.Random) -> List[str]:
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+
+    # caminho vetorizado: todas as palavras avançam juntas, um símbolo por passo.
+    # Só vale se as contagens de todos os estados (e as somas acumuladas sobre o
+    # alfabeto) cabem em int64; senão usa os inteiros Python, um por palavra.
+    maior = max(int(max(c)) for c in contagens[:k + 1])
+    if np is not None and maior * max(1, len(alfabeto)) < 2 ** 63:
+        gerador = np.random.default_rng(rng.getrandbits(64))
+        t = np.array(tabela, dtype=np.int64)
+        c = [np.asarray(x, dtype=np.int64) for x in contagens[:k + 1]]
+        estado = np.full(quantidade, i0, dtype=np.int64)
+        escolhas = np.empty((quantidade, k), dtype=np.int64)
+        for passo in range(k):
+            resto = k - passo
+            # acumulado[q][j] = complementos aceitos pelos símbolos 0..j a partir de q
+            acumulado = np.cumsum(c[resto - 1][t], axis=1)
+            sorteio = gerador.integers(0, c[resto][estado])
+            j = (acumulado[estado] <= sorteio[:, None]).sum(axis=1)
+            escolhas[:, passo] = j
+            estado = t[estado, j]
+        if k and all(len(s) == 1 for s in alfabeto):
+            # símbolos de um caractere: cada linha de code points vira uma string
+            codigos = np.array([ord(s) for s in alfabeto], dtype=np.uint32)[escolhas]
+            return codigos.view(f"<U{k}").ravel().tolist()
+        return ["".join(alfabeto[j] for j in linha) for linha in escolhas.tolist()]
+
+    palavras: List[str] = []
+    for _ in range(quantidade):
+        estado = i0
+        letras: List[str] = []
+        for resto in range(k, 0, -1):
+            sorteio = rng.randrange(int(contagens[resto][estado]))
+            for j, d in enumerate(tabela[estado]):
+                peso = int(contagens[resto - 1][d])
+                if sorteio < peso:
+                    letras.append(alfabeto[j])
+                    estado = d
+                    break
+                sorteio -= peso
+        palavras.append("".join(letras))
+    return palavras
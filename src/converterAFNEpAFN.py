@@ -1,9 +1,13 @@
 import json
-from testar_palavra import Automato
+from typing import Dict, FrozenSet, Iterable, Set
+
+from testar_palavra import Automato, EPSILON
 
 # Classe feita por Anderson R. Santos
 class AFNEpAFN:
-    def __init__(self):
+    def __init__(self, aparar=False):
+        # aparar=True remove estados inacessíveis/mortos antes da conversão (ver aparar.py)
+        self.aparar = aparar
         self.alfabeto = []
         self.estados = []
         self.estados_iniciais = [] 
@@ -148,36 +152,150 @@ class AFNEpAFN:
                             pilha.append(d)
         return fecho
 
+    def _para_automato(self):
+        transicoes = {}
+        for (origem, simbolo), destinos in self.transicoes.items():
+            transicoes.setdefault(origem, {}).setdefault(simbolo, set()).update(destinos)
+        return Automato(self.estados, self.alfabeto, self.estados_iniciais, self.estados_finais, transicoes)
+
+    def _aparar(self):
+        from aparar import aparar_automato, resumo_poda
+
+        automato, estatisticas = aparar_automato(self._para_automato())
+
+        self.estados = [e for e in self.estados if e in automato.estados]
+        self.estados_iniciais = [e for e in self.estados_iniciais if e in automato.iniciais]
+        self.estados_finais = [e for e in self.estados_finais if e in automato.finais]
+        self.transicoes = {}
+        for origem, mapa in automato.transicoes.items():
+            for simbolo, destinos in mapa.items():
+                self.transicoes[(origem, simbolo)] = list(destinos)
+        print(resumo_poda(estatisticas))
+
     def converter(self):
+        if self.aparar:
+            self._aparar()
+
         # Verifica se há alguma transição epsilon
         tem_epsilon = any(simbolo == 'ε' for (origem, simbolo) in self.transicoes)
         if not tem_epsilon:
             print("\nEste autômato já é um AFN normal (não possui transições ε). Nenhuma conversão foi realizada.")
             return
 
-        fechos = {estado: self.fecho_epsilon(estado) for estado in self.estados}
-        nova_tabela = {estado: {simbolo: set() for simbolo in self.alfabeto} for estado in self.estados}
-        novos_finais = set()
+        afn = remover_epsilon(self._para_automato(), aparar=self.aparar)
+
+        # Tabela esparsa {estado: {simbolo: set(destinos)}}: só os símbolos com destino
+        self.transicoes = afn.transicoes
+        self.estados = [e for e in self.estados if e in afn.estados]
+        self.estados_finais = list(afn.finais)
+        self.estados_iniciais = list(afn.iniciais)  # substitui pelo fecho expandido
+
+
+class FechosEpsilon:
+    """
+    Fecho-ε de cada estado, calculado sob demanda na primeira consulta e
+    reaproveitado. Diferente de `_fechos_epsilon`, não percorre os estados que
+    nunca são consultados (usado pelas buscas de antichains.py).
+    """
+
+    __slots__ = ("automato", "cache")
 
-        for estado in self.estados:
-            for simbolo in self.alfabeto:
-                destinos = set()
-                for e in fechos[estado]:
-                    if (e, simbolo) in self.transicoes:
-                        for d in self.transicoes[(e, simbolo)]:
-                            destinos |= self.fecho_epsilon(d)
-                nova_tabela[estado][simbolo] = destinos
+    def __init__(self, automato: Automato) -> None:
+        self.automato = automato
+        self.cache: Dict[str, FrozenSet[str]] = {}
 
-            # Estado é final se seu fecho contém um estado final original
-            if any(f in self.estados_finais for f in fechos[estado]):
-                novos_finais.add(estado)
+    def de(self, estado: str) -> FrozenSet[str]:
+        fecho = self.cache.get(estado)
+        if fecho is None:
+            visitados = {estado}
+            pilha = [estado]
+            while pilha:
+                atual = pilha.pop()
+                for d in self.automato.transicoes.get(atual, {}).get(EPSILON, ()):
+                    if d not in visitados:
+                        visitados.add(d)
+                        pilha.append(d)
+            fecho = frozenset(visitados)
+            self.cache[estado] = fecho
+        return fecho
+
+    def de_conjunto(self, estados: Iterable[str]) -> FrozenSet[str]:
+        resultado: Set[str] = set()
+        for e in estados:
+            resultado |= self.de(e)
+        return frozenset(resultado)
+
+    def post(self, conjunto: Iterable[str], simbolo: str) -> FrozenSet[str]:
+        """Estados alcançados por `simbolo` seguido de ε-transições."""
+        transicoes = self.automato.transicoes
+        resultado: Set[str] = set()
+        for e in conjunto:
+            for d in transicoes.get(e, {}).get(simbolo, ()):
+                resultado |= self.de(d)
+        return frozenset(resultado)
+
+
+def _fechos_epsilon(automato: Automato) -> Dict[str, Set[str]]:
+    fechos: Dict[str, Set[str]] = {}
+    for estado in automato.estados:
+        fecho = {estado}
+        pilha = [estado]
+        while pilha:
+            atual = pilha.pop()
+            for d in automato.transicoes.get(atual, {}).get(EPSILON, ()):
+                if d not in fecho:
+                    fecho.add(d)
+                    pilha.append(d)
+        fechos[estado] = fecho
+    return fechos
+
+
+def remover_epsilon(automato: Automato, aparar: bool = False) -> Automato:
+    """
+    Remove as ε-transições de um AFN-ε, retornando um AFN equivalente.
+
+    A tabela gerada é esparsa: cada estado só recebe os símbolos que de fato
+    aparecem em algum estado do seu fecho-ε, e o alvo (fecho dos destinos) de cada
+    par (estado, símbolo) original é calculado uma única vez. Custo proporcional
+    ao número de transições, e não a |Q|·|Σ|.
+
+    Como no conversor interativo, os novos iniciais são o fecho-ε dos iniciais e
+    um estado é final se seu fecho contém um final original. Com aparar=True,
+    remove no fim os estados que ficaram inacessíveis sem as ε-transições.
+    """
+    fechos = _fechos_epsilon(automato)
+
+    # alvos[e][simbolo] = união dos fechos dos destinos de e por simbolo
+    alvos: Dict[str, Dict[str, Set[str]]] = {}
+    for e, mapa in automato.transicoes.items():
+        for simbolo, destinos in mapa.items():
+            if simbolo == EPSILON or not destinos:
+                continue
+            alvo = alvos.setdefault(e, {}).setdefault(simbolo, set())
+            for d in destinos:
+                alvo |= fechos[d]
 
-        # Novo conjunto inicial = união dos fechos dos estados iniciais originais
-        fecho_iniciais = set()
-        for e in self.estados_iniciais:
-            fecho_iniciais |= fechos[e]
+    nova_tabela: Dict[str, Dict[str, Set[str]]] = {}
+    novos_finais: Set[str] = set()
+    for estado, fecho in fechos.items():
+        linha: Dict[str, Set[str]] = {}
+        for e in fecho:
+            for simbolo, alvo in alvos.get(e, {}).items():
+                if simbolo in linha:
+                    linha[simbolo] |= alvo
+                else:
+                    linha[simbolo] = set(alvo)
+        if linha:
+            nova_tabela[estado] = linha
+        if not automato.finais.isdisjoint(fecho):
+            novos_finais.add(estado)
 
-        self.transicoes = nova_tabela
-        self.estados_finais = list(novos_finais)
-        self.estados_iniciais = list(fecho_iniciais)  # substitui pelo fecho expandido
+    fecho_iniciais: Set[str] = set()
+    for e in automato.iniciais:
+        fecho_iniciais |= fechos[e]
 
+    afn = Automato(automato.estados, automato.alfabeto - {EPSILON}, fecho_iniciais, novos_finais, nova_tabela)
+    if aparar:
+        from aparar import aparar_automato
+        afn, _ = aparar_automato(afn)
+    return afn
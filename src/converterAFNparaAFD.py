@@ -3,17 +3,24 @@ from typing import Dict, Set, FrozenSet, Tuple, List
 
 from testar_palavra import Automato
 
+DEAD = "∅"  # estado morto/sumidouro
+
 
 def _subset_name(subset: FrozenSet[str]) -> str:
     if not subset:
-        return "∅"
+        return DEAD
     # Nomeia o subconjunto separado por vírgulas (ex.: q1,q2)
     return ",".join(sorted(subset))
 
 
-def converter_afn_para_afd(afn: Automato):
+def converter_afn_para_afd(afn: Automato, aparar: bool = False, por_classes: bool = False):
     """
     Converte um AFN para um AFD usando o método dos subconjuntos.
+    Com aparar=True, remove antes os estados inacessíveis e mortos do AFN
+    (ver aparar.py), o que reduz os subconjuntos gerados.
+    Com por_classes=True, a construção itera sobre classes de símbolos
+    equivalentes (ver classes_simbolos.py) e o resultado é expandido no final;
+    o AFD retornado é o mesmo.
     Retorna uma tupla (alfabeto, estados, inicial, finais, transicoes) onde:
       - alfabeto: List[str]
       - estados: List[str]
@@ -26,6 +33,15 @@ def converter_afn_para_afd(afn: Automato):
         if "ε" in mapa:
             raise ValueError("AFN contém transições ε. Use a conversão AFN-ε → AFN antes (opção 1).")
 
+    if aparar:
+        from aparar import aparar_automato
+        afn, _ = aparar_automato(afn)
+
+    if por_classes:
+        from classes_simbolos import comprimir_automato, expandir_afd
+        comprimido, membros = comprimir_automato(afn)
+        return expandir_afd(converter_afn_para_afd(comprimido), membros, sorted(afn.alfabeto))
+
     alfabeto = sorted(list(afn.alfabeto))
 
     # Subconjunto inicial = conjunto de estados iniciais do AFN
@@ -39,7 +55,6 @@ def converter_afn_para_afd(afn: Automato):
     dfa_finais: Set[str] = set()
 
     tem_estado_morto = False
-    DEAD = "∅"  # estado morto/sumidouro
 
     while fila:
         atual = fila.popleft()
@@ -115,7 +130,8 @@ def converter_afn_para_afd_cli():
         return
 
     try:
-        alfabeto, estados, inicial, finais, trans = converter_afn_para_afd(afn)
+        from cache_resultados import converter_afn_para_afd_cache
+        alfabeto, estados, inicial, finais, trans = converter_afn_para_afd_cache(afn)
     except Exception as e:
         print(f"Erro na conversão: {e}")
         return
@@ -1,18 +1,29 @@
 from typing import Dict, List, Set, FrozenSet
 from collections import defaultdict, deque
 from testar_palavra import Automato
-from converterAFNEpAFN import AFNEpAFN
-from converterAFNparaAFD import converter_afn_para_afd
 
 
 def minimizar_afd(alfabeto: List[str], estados: List[str], inicial: str,
-                  finais: List[str], transicoes: Dict[str, Dict[str, str]]):
+                  finais: List[str], transicoes: Dict[str, Dict[str, str]],
+                  aparar: bool = False, por_classes: bool = False):
 
     if not estados:
         raise ValueError("AFD não possui estados")
     if inicial not in estados:
         raise ValueError(f"Estado inicial '{inicial}' não está na lista de estados")
 
+    if aparar:
+        # remove inacessíveis e funde os mortos num único sumidouro antes de particionar
+        from aparar import aparar_afd
+        (alfabeto, estados, inicial, finais, transicoes), _ = aparar_afd(
+            alfabeto, estados, inicial, finais, transicoes)
+
+    if por_classes:
+        # particiona iterando só sobre um representante de cada classe de símbolos
+        from classes_simbolos import comprimir_afd, expandir_afd
+        comprimido, membros = comprimir_afd(alfabeto, estados, inicial, finais, transicoes)
+        return expandir_afd(minimizar_afd(*comprimido), membros, alfabeto)
+
     finais_set = set(finais)
     nao_finais_set = set(estados) - finais_set
 
@@ -56,7 +67,12 @@ def minimizar_afd(alfabeto: List[str], estados: List[str], inicial: str,
                         else:
                             W.append(frozenset(Y_minus_X))
 
+    return _montar_afd_minimo(alfabeto, inicial, finais, transicoes, P)
+
 
+def _montar_afd_minimo(alfabeto: List[str], inicial: str, finais: List[str],
+                       transicoes: Dict[str, Dict[str, str]], P: Set[FrozenSet[str]]):
+    # Monta o AFD mínimo a partir da partição final (comum aos dois motores)
     estado_para_bloco: Dict[str, FrozenSet[str]] = {}
     for bloco in P:
         for estado in bloco:
@@ -94,8 +110,78 @@ def minimizar_afd(alfabeto: List[str], estados: List[str], inicial: str,
     return (alfabeto, novos_estados, novo_inicial, novos_finais_lista, novas_transicoes)
 
 
+def minimizar_afd_moore(alfabeto: List[str], estados: List[str], inicial: str,
+                        finais: List[str], transicoes: Dict[str, Dict[str, str]],
+                        aparar: bool = False, por_classes: bool = False):
+    """
+    Minimização alternativa (refinamento de Moore vetorizado com NumPy), com a
+    mesma interface e a mesma saída de `minimizar_afd` (também para AFDs parciais).
+
+    A cada rodada, a assinatura de cada estado é (bloco atual, bloco do sucessor
+    por cada símbolo), calculada de uma vez sobre a tabela de transições, e os
+    blocos são renumerados com np.unique. Para quando o número de blocos não muda.
+    Cada rodada é O(|Q|·|Σ|) em código nativo, então vence o Hopcroft em Python
+    quando o AFD converge em poucas rodadas (AFDs "rasos"); em AFDs profundos,
+    que exigem ~|Q| rodadas, o Hopcroft vence (ver benchmarks/bench_minimizacao.py).
+    """
+    import numpy as np
+
+    if not estados:
+        raise ValueError("AFD não possui estados")
+    if inicial not in estados:
+        raise ValueError(f"Estado inicial '{inicial}' não está na lista de estados")
+
+    if aparar:
+        from aparar import aparar_afd
+        (alfabeto, estados, inicial, finais, transicoes), _ = aparar_afd(
+            alfabeto, estados, inicial, finais, transicoes)
+
+    if por_classes:
+        from classes_simbolos import comprimir_afd, expandir_afd
+        comprimido, membros = comprimir_afd(alfabeto, estados, inicial, finais, transicoes)
+        return expandir_afd(minimizar_afd_moore(*comprimido), membros, alfabeto)
+
+    n = len(estados)
+    indice = {e: i for i, e in enumerate(estados)}
+    # a linha n é um sumidouro implícito para as transições ausentes (AFD parcial).
+    # Como no Hopcroft acima (onde destino ausente nunca pertence a um bloco), ele
+    # começa num bloco só seu: estados sem transição não se fundem com estados que
+    # vão a um estado morto explícito, e os dois motores dão a mesma saída.
+    tabela = np.full((n + 1, len(alfabeto)), n, dtype=np.int64)
+    for e, mapa in transicoes.items():
+        i = indice[e]
+        for j, simbolo in enumerate(alfabeto):
+            destino = mapa.get(simbolo)
+            if destino:
+                tabela[i, j] = indice[destino]
+
+    bloco = np.zeros(n + 1, dtype=np.int64)
+    bloco[[indice[f] for f in finais]] = 1
+    bloco[n] = 2
+    num_blocos = len(np.unique(bloco))
+
+    while True:
+        assinatura = np.column_stack([bloco, bloco[tabela]])
+        _, novo = np.unique(assinatura, axis=0, return_inverse=True)
+        bloco = novo.reshape(-1)
+        novo_num = int(bloco.max()) + 1
+        if novo_num == num_blocos:
+            break
+        num_blocos = novo_num
+
+    grupos: Dict[int, List[str]] = {}
+    for e, b in zip(estados, bloco[:n].tolist()):
+        grupos.setdefault(b, []).append(e)
+    P: Set[FrozenSet[str]] = {frozenset(g) for g in grupos.values()}
+
+    return _montar_afd_minimo(alfabeto, inicial, finais, transicoes, P)
+
+
 def minimizar_afd_cli():
 
+    # resultados ficam em cache em disco: rodar de novo sobre o mesmo JSON não recalcula
+    from cache_resultados import converter_afn_para_afd_cache, minimizar_afd_cache, remover_epsilon_cache
+
     print("\n=========================")
     print("Minimizar AFD")
     print("=========================\n")
@@ -127,8 +213,8 @@ def minimizar_afd_cli():
         if tem_epsilon:
             print("\nO autômato contém transições ε. Convertendo AFN-ε → AFN → AFD...")
             try:
-                afne_converter = _converter_afne_silencioso(automato)
-                alfabeto, estados, inicial, finais, transicoes = converter_afn_para_afd(afne_converter)
+                afn = remover_epsilon_cache(automato, aparar=True)
+                alfabeto, estados, inicial, finais, transicoes = converter_afn_para_afd_cache(afn, aparar=True)
                 print("Conversão concluída.\n")
             except Exception as e:
                 print(f"Erro na conversão: {e}")
@@ -146,7 +232,7 @@ def minimizar_afd_cli():
             if eh_afn or len(automato.iniciais) > 1:
                 print("\nO autômato é AFN. Convertendo AFN → AFD...")
                 try:
-                    alfabeto, estados, inicial, finais, transicoes = converter_afn_para_afd(automato)
+                    alfabeto, estados, inicial, finais, transicoes = converter_afn_para_afd_cache(automato, aparar=True)
                     print("Conversão concluída.\n")
                 except Exception as e:
                     print(f"Erro na conversão: {e}")
@@ -213,10 +299,11 @@ def minimizar_afd_cli():
         return
 
     try:
+        from aparar import aparar_afd, resumo_poda
+        afd_podado, estatisticas = aparar_afd(alfabeto, estados, inicial, finais, transicoes)
+        print(resumo_poda(estatisticas))
         print("Minimizando AFD...")
-        alfabeto_min, estados_min, inicial_min, finais_min, trans_min = minimizar_afd(
-            alfabeto, estados, inicial, finais, transicoes
-        )
+        alfabeto_min, estados_min, inicial_min, finais_min, trans_min = minimizar_afd_cache(*afd_podado)
     except Exception as e:
         print(f"Erro ao minimizar: {e}")
         return
@@ -240,51 +327,3 @@ def minimizar_afd_cli():
     print(f"Estados depois: {len(estados_min)}")
     print(f"Redução: {len(estados) - len(estados_min)} estado(s)")
 
-
-def _converter_afne_silencioso(automato: Automato) -> Automato:
-
-    def fecho_epsilon(estado):
-        fecho = {estado}
-        pilha = [estado]
-        while pilha:
-            atual = pilha.pop()
-            destinos_eps = automato.transicoes.get(atual, {}).get('ε', set())
-            for d in destinos_eps:
-                if d not in fecho:
-                    fecho.add(d)
-                    pilha.append(d)
-        return fecho
-
-    fechos = {estado: fecho_epsilon(estado) for estado in automato.estados}
-
-    nova_tabela = {}
-    for estado in automato.estados:
-        nova_tabela[estado] = {}
-        for simbolo in automato.alfabeto:
-            if simbolo == 'ε':
-                continue
-            destinos = set()
-            for e in fechos[estado]:
-                dest_por_simbolo = automato.transicoes.get(e, {}).get(simbolo, set())
-                for d in dest_por_simbolo:
-                    destinos |= fechos[d]
-            if destinos:
-                nova_tabela[estado][simbolo] = destinos
-
-    novos_finais = set()
-    for estado in automato.estados:
-        if any(f in automato.finais for f in fechos[estado]):
-            novos_finais.add(estado)
-
-    fecho_iniciais = set()
-    for e in automato.iniciais:
-        fecho_iniciais |= fechos[e]
-
-    novo = Automato()
-    novo.alfabeto = automato.alfabeto - {'ε'}
-    novo.estados = automato.estados
-    novo.iniciais = fecho_iniciais
-    novo.finais = novos_finais
-    novo.transicoes = nova_tabela
-
-    return novo
\ No newline at end of file
@@ -0,0 +1,246 @@
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from testar_palavra import Automato
+from converterAFNparaAFD import DEAD
+
+
+# Expressões regulares → autômatos pela construção de Glushkov (das posições).
+#
+# Sintaxe aceita:
+#   ab      concatenação          a|b    união
+#   a*      fecho de Kleene       a+     uma ou mais vezes
+#   a?      opcional              (...)  agrupamento; () é a palavra vazia
+#   [abc]   classe de caracteres  [a-z0-9] intervalos
+#   [^ab]   classe negada (exige o parâmetro alfabeto)
+#   .       qualquer símbolo do alfabeto (exige o parâmetro alfabeto)
+#   \x      x literal (ex.: \* ou \|)
+#
+# O AFN resultante não tem ε-transições e tem |posições| + 1 estados, então a
+# etapa AFN-ε → AFN não é necessária.
+
+
+class _Analisador:
+    """
+    Analisador descendente recursivo. Produz a árvore como tuplas:
+      ("pos", i)  folha (posição i)    ("vazio",)  palavra vazia
+      ("cat", x, y)  ("uni", x, y)  ("estrela", x)  ("mais", x)  ("opc", x)
+    e preenche `simbolos[i]` com o conjunto de símbolos aceitos na posição i.
+    """
+
+    def __init__(self, expressao: str, alfabeto: Optional[Iterable[str]]) -> None:
+        self.expr = expressao
+        self.i = 0
+        self.alfabeto: Optional[Set[str]] = set(alfabeto) if alfabeto is not None else None
+        self.simbolos: List[FrozenSet[str]] = [frozenset()]  # posição 0 é o estado inicial
+
+    def _erro(self, msg: str) -> ValueError:
+        return ValueError(f"Expressão regular inválida na coluna {self.i + 1}: {msg}")
+
+    def _olhar(self) -> Optional[str]:
+        return self.expr[self.i] if self.i < len(self.expr) else None
+
+    def _folha(self, simbolos: Set[str]):
+        if not simbolos:
+            raise self._erro("classe de caracteres vazia")
+        self.simbolos.append(frozenset(simbolos))
+        return ("pos", len(self.simbolos) - 1)
+
+    def analisar(self):
+        arvore = self._uniao()
+        if self.i != len(self.expr):
+            raise self._erro(f"caractere inesperado '{self.expr[self.i]}'")
+        return arvore
+
+    def _uniao(self):
+        arvore = self._concatenacao()
+        while self._olhar() == "|":
+            self.i += 1
+            arvore = ("uni", arvore, self._concatenacao())
+        return arvore
+
+    def _concatenacao(self):
+        arvore = None
+        while self._olhar() is not None and self._olhar() not in "|)":
+            fator = self._fator()
+            arvore = fator if arvore is None else ("cat", arvore, fator)
+        return arvore if arvore is not None else ("vazio",)
+
+    def _fator(self):
+        arvore = self._atomo()
+        while self._olhar() is not None and self._olhar() in "*+?":
+            op = self._olhar()
+            self.i += 1
+            arvore = ({"*": "estrela", "+": "mais", "?": "opc"}[op], arvore)
+        return arvore
+
+    def _atomo(self):
+        c = self._olhar()
+        if c == "(":
+            self.i += 1
+            arvore = self._uniao()
+            if self._olhar() != ")":
+                raise self._erro("')' esperado")
+            self.i += 1
+            return arvore
+        if c == "[":
+            return self._folha(self._classe())
+        if c == ".":
+            self.i += 1
+            return self._folha(set(self._exigir_alfabeto(".")))
+        if c in ("*", "+", "?"):
+            raise self._erro(f"'{c}' sem operando")
+        return self._folha({self._literal()})
+
+    def _literal(self) -> str:
+        c = self.expr[self.i]
+        if c == "\\":
+            self.i += 1
+            if self.i >= len(self.expr):
+                raise self._erro("'\\' no fim da expressão")
+            c = self.expr[self.i]
+        self.i += 1
+        return c
+
+    def _classe(self) -> Set[str]:
+        self.i += 1  # '['
+        negada = self._olhar() == "^"
+        if negada:
+            self.i += 1
+        simbolos: Set[str] = set()
+        while self._olhar() != "]":
+            if self._olhar() is None:
+                raise self._erro("']' esperado")
+            inicio = self._literal()
+            if self._olhar() == "-" and self.i + 1 < len(self.expr) and self.expr[self.i + 1] != "]":
+                self.i += 1
+                fim = self._literal()
+                if ord(fim) < ord(inicio):
+                    raise self._erro(f"intervalo invertido {inicio}-{fim}")
+                simbolos.update(chr(x) for x in range(ord(inicio), ord(fim) + 1))
+            else:
+                simbolos.add(inicio)
+        self.i += 1  # ']'
+        if negada:
+            return set(self._exigir_alfabeto("[^...]")) - simbolos
+        return simbolos
+
+    def _exigir_alfabeto(self, construcao: str) -> Set[str]:
+        if self.alfabeto is None:
+            raise self._erro(f"'{construcao}' exige que o alfabeto seja informado")
+        return self.alfabeto
+
+
+def _glushkov(arvore, n: int):
+    """Calcula (anulável, primeiros, últimos) da árvore e preenche `seguintes`."""
+    seguintes: List[Set[int]] = [set() for _ in range(n)]
+
+    def visitar(no) -> Tuple[bool, Set[int], Set[int]]:
+        tipo = no[0]
+        if tipo == "vazio":
+            return True, set(), set()
+        if tipo == "pos":
+            return False, {no[1]}, {no[1]}
+        if tipo == "uni":
+            a1, p1, u1 = visitar(no[1])
+            a2, p2, u2 = visitar(no[2])
+            return a1 or a2, p1 | p2, u1 | u2
+        if tipo == "cat":
+            a1, p1, u1 = visitar(no[1])
+            a2, p2, u2 = visitar(no[2])
+            for u in u1:
+                seguintes[u] |= p2
+            return a1 and a2, (p1 | p2) if a1 else p1, (u1 | u2) if a2 else u2
+        a, p, u = visitar(no[1])
+        if tipo in ("estrela", "mais"):
+            for x in u:
+                seguintes[x] |= p
+        # a* e a? sempre aceitam a palavra vazia; a+ só se a aceitar
+        return (a if tipo == "mais" else True), p, u
+
+    anulavel, primeiros, ultimos = visitar(arvore)
+    seguintes[0] = primeiros
+    return anulavel, ultimos, seguintes
+
+
+def _analisar(expressao: str, alfabeto: Optional[Iterable[str]]):
+    analisador = _Analisador(expressao, alfabeto)
+    arvore = analisador.analisar()
+    simbolos = analisador.simbolos
+    anulavel, ultimos, seguintes = _glushkov(arvore, len(simbolos))
+    finais = set(ultimos)
+    if anulavel:
+        finais.add(0)
+    todos = set().union(*simbolos)
+    if alfabeto is not None:
+        todos |= set(alfabeto)
+    return simbolos, seguintes, finais, todos
+
+
+def regex_para_automato(expressao: str, alfabeto: Optional[Iterable[str]] = None) -> Automato:
+    """
+    Compila a expressão num AFN sem ε (autômato de Glushkov). O estado "q0" é o
+    inicial e "q<i>" corresponde à i-ésima posição (símbolo) da expressão.
+    Sem `alfabeto`, o alfabeto é o conjunto de símbolos que aparecem na expressão.
+    """
+    simbolos, seguintes, finais, todos = _analisar(expressao, alfabeto)
+    nomes = [f"q{i}" for i in range(len(simbolos))]
+
+    transicoes: Dict[str, Dict[str, Set[str]]] = {}
+    for i, proximos in enumerate(seguintes):
+        for j in proximos:
+            for s in simbolos[j]:
+                transicoes.setdefault(nomes[i], {}).setdefault(s, set()).add(nomes[j])
+
+    return Automato(nomes, todos, [nomes[0]], [nomes[i] for i in finais], transicoes)
+
+
+def regex_para_afd(expressao: str, alfabeto: Optional[Iterable[str]] = None):
+    """
+    Compila a expressão diretamente num AFD (método das posições/followpos): cada
+    estado do AFD é um conjunto de posições, sem passar pelo AFN intermediário.
+    Retorna (alfabeto, estados, inicial, finais, transicoes) no mesmo formato de
+    `converter_afn_para_afd`, pronto para `minimizar_afd`. Estados são nomeados
+    D0, D1, ... em ordem de descoberta; "∅" é o estado morto, se necessário.
+    """
+    simbolos, seguintes, finais, todos = _analisar(expressao, alfabeto)
+    alfabeto_ord = sorted(todos)
+
+    inicial: FrozenSet[int] = frozenset({0})
+    nomes: Dict[FrozenSet[int], str] = {inicial: "D0"}
+    pendentes: List[FrozenSet[int]] = [inicial]
+    transicoes: Dict[str, Dict[str, str]] = {}
+    dfa_finais: Set[str] = set()
+    tem_estado_morto = False
+
+    while pendentes:
+        atual = pendentes.pop()
+        nome = nomes[atual]
+        transicoes[nome] = {}
+        if not finais.isdisjoint(atual):
+            dfa_finais.add(nome)
+
+        # agrupa as posições seguintes pelo símbolo que as ativa
+        por_simbolo: Dict[str, Set[int]] = {}
+        for p in atual:
+            for j in seguintes[p]:
+                for s in simbolos[j]:
+                    por_simbolo.setdefault(s, set()).add(j)
+
+        for s in alfabeto_ord:
+            prox = por_simbolo.get(s)
+            if not prox:
+                transicoes[nome][s] = DEAD
+                tem_estado_morto = True
+                continue
+            prox_fs = frozenset(prox)
+            if prox_fs not in nomes:
+                nomes[prox_fs] = f"D{len(nomes)}"
+                pendentes.append(prox_fs)
+            transicoes[nome][s] = nomes[prox_fs]
+
+    estados = list(nomes.values())
+    if tem_estado_morto:
+        estados.append(DEAD)
+        transicoes[DEAD] = {s: DEAD for s in alfabeto_ord}
+
+    return alfabeto_ord, sorted(estados), "D0", sorted(dfa_finais), transicoes
@@ -0,0 +1,138 @@
+from collections import deque
+from typing import Dict, Hashable, List, Optional, Tuple
+
+from testar_palavra import Automato, EPSILON
+
+
+# Equivalência e inclusão de linguagens entre AFDs, sem minimizar nenhum deles.
+#
+# Os AFDs seguem o formato (alfabeto, estados, inicial, finais, transicoes)
+# retornado por `converter_afn_para_afd`/`minimizar_afd`. Transições ausentes
+# (AFD parcial) e símbolos fora do alfabeto de um dos lados levam a um
+# sumidouro implícito (None), não final.
+
+
+def como_afd(automato):
+    """
+    Aceita um AFD no formato de tupla ou um `Automato`. Um `Automato` já
+    determinístico é usado diretamente; caso contrário é convertido (removendo
+    ε-transições, se houver, e aplicando o método dos subconjuntos).
+    """
+    if not isinstance(automato, Automato):
+        return automato
+
+    tem_epsilon = any(EPSILON in mapa for mapa in automato.transicoes.values())
+    deterministico = len(automato.iniciais) == 1 and all(
+        len(ds) <= 1 for mapa in automato.transicoes.values() for ds in mapa.values()
+    )
+    if deterministico and not tem_epsilon:
+        transicoes = {
+            o: {s: next(iter(ds)) for s, ds in mapa.items() if ds}
+            for o, mapa in automato.transicoes.items()
+        }
+        return (
+            sorted(automato.alfabeto),
+            sorted(automato.estados),
+            next(iter(automato.iniciais)),
+            sorted(automato.finais),
+            transicoes,
+        )
+
+    from converterAFNparaAFD import converter_afn_para_afd
+    if tem_epsilon:
+        from converterAFNEpAFN import remover_epsilon
+        automato = remover_epsilon(automato)
+    return converter_afn_para_afd(automato)
+
+
+def reconstruir_palavra(caminho: Dict[Tuple, Optional[Tuple[Tuple, str]]], par: Tuple) -> str:
+    """Palavra que leva da raiz da busca em largura até `par`, seguindo `caminho`."""
+    simbolos: List[str] = []
+    while caminho[par] is not None:
+        par, simbolo = caminho[par]
+        simbolos.append(simbolo)
+    return "".join(reversed(simbolos))
+
+
+def equivalentes_afd(a, b) -> Tuple[bool, Optional[str]]:
+    """
+    Verifica se L(a) = L(b) com o algoritmo de Hopcroft–Karp (union-find sobre
+    pares de estados, quase linear). A exploração é em largura, então o contraexemplo
+    retornado é uma palavra de comprimento mínimo aceita por exatamente um dos dois.
+
+    Retorna (True, None) ou (False, contraexemplo).
+    """
+    alf_a, _, ini_a, fin_a, trans_a = como_afd(a)
+    alf_b, _, ini_b, fin_b, trans_b = como_afd(b)
+    finais_a, finais_b = set(fin_a), set(fin_b)
+    simbolos = sorted(set(alf_a) | set(alf_b))
+
+    pai: Dict[Hashable, Hashable] = {}
+
+    def achar(x):
+        raiz = x
+        while pai.get(raiz, raiz) != raiz:
+            raiz = pai[raiz]
+        while x != raiz:
+            pai[x], x = raiz, pai[x]
+        return raiz
+
+    # os estados de cada lado recebem uma marca para não colidirem por nome
+    pai[(1, ini_b)] = (0, ini_a)
+    inicio = (ini_a, ini_b)
+    caminho: Dict[Tuple, Optional[Tuple[Tuple, str]]] = {inicio: None}
+    fila: deque[Tuple] = deque([inicio])
+
+    while fila:
+        par = fila.popleft()
+        p, q = par
+        if (p in finais_a) != (q in finais_b):
+            return False, reconstruir_palavra(caminho, par)
+
+        for s in simbolos:
+            p2 = trans_a.get(p, {}).get(s) if p is not None else None
+            q2 = trans_b.get(q, {}).get(s) if q is not None else None
+            r1, r2 = achar((0, p2)), achar((1, q2))
+            if r1 != r2:
+                pai[r2] = r1
+                proximo = (p2, q2)
+                caminho[proximo] = (par, s)
+                fila.append(proximo)
+
+    return True, None
+
+
+def incluso_afd(a, b) -> Tuple[bool, Optional[str]]:
+    """
+    Verifica se L(a) ⊆ L(b) explorando em largura o produto dos dois AFDs (a
+    inclusão não é simétrica, então aqui não há union-find).
+
+    Retorna (True, None) ou (False, palavra mais curta aceita por a e rejeitada por b).
+    """
+    alf_a, _, ini_a, fin_a, trans_a = como_afd(a)
+    _, _, ini_b, fin_b, trans_b = como_afd(b)
+    finais_a, finais_b = set(fin_a), set(fin_b)
+    simbolos = sorted(alf_a)
+
+    inicio = (ini_a, ini_b)
+    caminho: Dict[Tuple, Optional[Tuple[Tuple, str]]] = {inicio: None}
+    fila: deque[Tuple] = deque([inicio])
+
+    while fila:
+        par = fila.popleft()
+        p, q = par
+        if p in finais_a and q not in finais_b:
+            return False, reconstruir_palavra(caminho, par)
+
+        for s in simbolos:
+            p2 = trans_a.get(p, {}).get(s)
+            if p2 is None:
+                # a não aceita mais nada a partir daqui
+                continue
+            q2 = trans_b.get(q, {}).get(s) if q is not None else None
+            proximo = (p2, q2)
+            if proximo not in caminho:
+                caminho[proximo] = (par, s)
+                fila.append(proximo)
+
+    return True, None
@@ -0,0 +1,133 @@
+import hashlib
+import os
+import tempfile
+from collections import deque
+from typing import Callable, Dict, List, Optional, Set
+
+from aparar import alcancaveis
+
+
+# Geração de código: transforma um AFD (normalmente o de `minimizar_afd`) numa
+# função Python especializada `casar(palavra) -> bool`, com as transições como
+# constantes. Evita a indireção genérica de `Automato.aceita` (conjuntos de
+# estados, fecho-ε, .get() encadeados) a cada caractere.
+#
+# Dois estilos de código:
+#   - "dict" (padrão): uma tupla de dicts {simbolo: proximo} indexada pelo estado
+#   - "if": cadeia de if/elif por estado e por símbolo, sem nenhuma busca em dict
+# Em ambos, estados dos quais nenhum final é alcançável rejeitam na hora.
+# No CPython o estilo "dict" costuma ser o mais rápido (ver
+# benchmarks/bench_matcher.py); o "if" gera um código legível, útil para inspeção.
+
+
+def _numerar(inicial: str, transicoes: Dict[str, Dict[str, str]], uteis: Set[str]) -> Dict[str, int]:
+    # numera os estados úteis em ordem de BFS a partir do inicial (inicial = 0)
+    numeros: Dict[str, int] = {inicial: 0}
+    fila: deque[str] = deque([inicial])
+    while fila:
+        atual = fila.popleft()
+        for simbolo in sorted(transicoes.get(atual, {})):
+            d = transicoes[atual][simbolo]
+            if d in uteis and d not in numeros:
+                numeros[d] = len(numeros)
+                fila.append(d)
+    return numeros
+
+
+def gerar_codigo_matcher(alfabeto: List[str], estados: List[str], inicial: str,
+                         finais: List[str], transicoes: Dict[str, Dict[str, str]],
+                         nome: str = "casar", modo: str = "dict") -> str:
+    """Retorna o código-fonte de um módulo que define a função `nome(palavra)`."""
+    if modo not in ("if", "dict"):
+        raise ValueError(f"Modo de geração inválido: {modo}")
+
+    predecessores: Dict[str, Set[str]] = {}
+    for o, mapa in transicoes.items():
+        for d in mapa.values():
+            predecessores.setdefault(d, set()).add(o)
+    uteis = alcancaveis(set(finais), predecessores)
+
+    linhas: List[str] = [
+        "# Gerado por gerar_matcher.py; não editar.",
+        "",
+        "",
+    ]
+    if inicial not in uteis:
+        linhas += [f"def {nome}(palavra):", "    return False", ""]
+        return "\n".join(linhas)
+
+    numeros = _numerar(inicial, transicoes, uteis)
+    tabela: List[Dict[str, int]] = [{} for _ in numeros]
+    for e, i in numeros.items():
+        for simbolo, d in sorted(transicoes.get(e, {}).items()):
+            if d in numeros:
+                tabela[i][simbolo] = numeros[d]
+    numeros_finais = sorted(numeros[f] for f in finais if f in numeros)
+
+    if modo == "dict":
+        linhas.pop()
+        linhas.append(f"_T = {tuple(tabela)!r}")
+        linhas.append(f"_F = frozenset({numeros_finais!r})")
+        linhas += [
+            "",
+            "",
+            f"def {nome}(palavra, _T=_T, _F=_F):",
+            "    estado = 0",
+            "    for c in palavra:",
+            "        estado = _T[estado].get(c)",
+            "        if estado is None:",
+            "            return False",
+            "    return estado in _F",
+            "",
+        ]
+        return "\n".join(linhas)
+
+    linhas += [f"def {nome}(palavra):", "    estado = 0", "    for c in palavra:"]
+    for i, mapa in enumerate(tabela):
+        linhas.append(f"        {'if' if i == 0 else 'elif'} estado == {i}:")
+        if not mapa:
+            linhas.append("            return False")
+            continue
+        for j, (simbolo, d) in enumerate(mapa.items()):
+            linhas.append(f"            {'if' if j == 0 else 'elif'} c == {simbolo!r}:")
+            linhas.append(f"                estado = {d}" if d != i else "                pass")
+        linhas.append("            else:")
+        linhas.append("                return False")
+    if len(numeros_finais) == 1:
+        linhas.append(f"    return estado == {numeros_finais[0]}")
+    else:
+        linhas.append(f"    return estado in {frozenset(numeros_finais)!r}")
+    linhas.append("")
+    return "\n".join(linhas)
+
+
+def compilar_matcher(alfabeto: List[str], estados: List[str], inicial: str,
+                     finais: List[str], transicoes: Dict[str, Dict[str, str]],
+                     modo: str = "dict", diretorio_cache: Optional[str] = None) -> Callable[[str], bool]:
+    """
+    Gera e compila o casador do AFD. Com `diretorio_cache`, o código é gravado
+    como módulo `.py` (nome pelo hash do código) e importado dali, de modo que o
+    Python reaproveita o bytecode (.pyc) nas próximas execuções.
+    """
+    codigo = gerar_codigo_matcher(alfabeto, estados, inicial, finais, transicoes, modo=modo)
+
+    if diretorio_cache is None:
+        namespace: Dict[str, object] = {}
+        exec(compile(codigo, "<matcher gerado>", "exec"), namespace)
+        return namespace["casar"]
+
+    import importlib.util
+
+    nome_modulo = "matcher_" + hashlib.sha256(codigo.encode("utf-8")).hexdigest()[:20]
+    caminho = os.path.join(diretorio_cache, nome_modulo + ".py")
+    if not os.path.exists(caminho):
+        os.makedirs(diretorio_cache, exist_ok=True)
+        fd, temporario = tempfile.mkstemp(dir=diretorio_cache, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(codigo)
+        os.replace(temporario, caminho)
+
+    spec = importlib.util.spec_from_file_location(nome_modulo, caminho)
+    modulo = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(modulo)
+    return modulo.casar
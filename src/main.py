@@ -1,11 +1,187 @@
-from converterAFNEpAFN import AFNEpAFN
-from converterAFNparaAFD import converter_afn_para_afd_cli
-from testar_palavra import testar_palavra_cli
-from converter_multi_para_afne import converter_multi_para_afne_cli
-from converter_minimizar_afd import minimizar_afd_cli
+import sys
 
+# Os módulos conversores são importados somente quando a opção correspondente
+# é escolhida, para que o programa inicie rápido (ex.: chamado em laços de shell).
 
-def main():
+
+def _executar_opcao(opcao_int):
+    if opcao_int == 0:
+        from converter_multi_para_afne import converter_multi_para_afne_cli
+        converter_multi_para_afne_cli()
+    elif opcao_int == 1:
+        from converterAFNEpAFN import AFNEpAFN
+        AFNEpAFN()
+    elif opcao_int == 2:
+        from converterAFNparaAFD import converter_afn_para_afd_cli
+        converter_afn_para_afd_cli()
+    elif opcao_int == 3:
+        from converter_minimizar_afd import minimizar_afd_cli
+        minimizar_afd_cli()
+    elif opcao_int == 4:
+        from testar_palavra import testar_palavra_cli
+        testar_palavra_cli()
+
+
+def _carregar(carregador, caminho):
+    """
+    Carrega o autômato de `caminho`. Em caso de erro (arquivo ausente, JSON
+    malformado, autômato inválido) imprime a mensagem e retorna None, para que o
+    subcomando saia com código 2 e não com o código de "rejeitada"/"diferente".
+    """
+    try:
+        return carregador(caminho)
+    except (OSError, ValueError) as e:
+        print(f"Erro ao carregar JSON: {e}", file=sys.stderr)
+        return None
+
+
+def _testar_cmd(args):
+    """
+    Subcomando não interativo: testar <arquivo.json> [palavra ...]
+    Sem palavras nos argumentos, lê uma palavra por linha da entrada padrão.
+    Imprime ACEITA/REJEITA por palavra e retorna 0 se todas forem aceitas, 1 se
+    alguma for rejeitada e 2 em erro de uso ou de carregamento.
+    """
+    if not args:
+        print("Uso: main.py testar <arquivo.json> [palavra ...]", file=sys.stderr)
+        return 2
+
+    # só leitura: a representação compacta ocupa bem menos memória em autômatos grandes
+    from automato_compacto import AutomatoCompacto
+
+    automato = _carregar(AutomatoCompacto.from_json, args[0])
+    if automato is None:
+        return 2
+    return _testar_palavras(automato, args[1:])
+
+
+def _regex_cmd(args):
+    """
+    Subcomando não interativo: regex [--alfabeto a,b,...] <expressao> [palavra ...]
+    Compila a expressão (construção de Glushkov, sem ε) e testa as palavras como `testar`.
+    O alfabeto é necessário para `.` e `[^...]`; expressão inválida retorna 2.
+    """
+    alfabeto = None
+    if args and args[0].startswith("--alfabeto"):
+        opcao, _, valor = args[0].partition("=")
+        if opcao != "--alfabeto" or (not valor and len(args) < 2):
+            args = []
+        elif valor:
+            args = args[1:]
+        else:
+            valor, args = args[1], args[2:]
+        alfabeto = [s.strip() for s in valor.split(",") if s.strip()]
+    if not args:
+        print("Uso: main.py regex [--alfabeto a,b,...] <expressao> [palavra ...]", file=sys.stderr)
+        return 2
+
+    from converter_regex import regex_para_automato
+
+    try:
+        automato = regex_para_automato(args[0], alfabeto)
+    except ValueError as e:
+        print(f"Erro na expressão regular: {e}", file=sys.stderr)
+        return 2
+    return _testar_palavras(automato, args[1:])
+
+
+def _testar_palavras(automato, palavras):
+    if not palavras:
+        palavras = (linha.rstrip("\n") for linha in sys.stdin)
+
+    todas_aceitas = True
+    for w in palavras:
+        aceito = automato.aceita(w)
+        todas_aceitas = todas_aceitas and aceito
+        print(f"{w}\t{'ACEITA' if aceito else 'REJEITA'}")
+    return 0 if todas_aceitas else 1
+
+
+def _comparar_cmd(nome, args):
+    """
+    Subcomandos não interativos: equivalentes|incluso <a.json> <b.json>
+    Retorna 0 se L(a) = L(b) (ou L(a) ⊆ L(b)) e 1 caso contrário, mostrando um
+    contraexemplo de comprimento mínimo; 2 em erro de uso ou de carregamento.
+    """
+    if len(args) != 2:
+        print(f"Uso: main.py {nome} <a.json> <b.json>", file=sys.stderr)
+        return 2
+
+    from testar_palavra import Automato
+
+    a = _carregar(Automato.from_json, args[0])
+    b = _carregar(Automato.from_json, args[1]) if a is not None else None
+    if a is None or b is None:
+        return 2
+    if nome == "equivalentes":
+        from equivalencia import equivalentes_afd
+        ok, contraexemplo = equivalentes_afd(a, b)
+    else:
+        # antichains: não determiniza os AFNs por completo
+        from antichains import incluso_afn
+        ok, contraexemplo = incluso_afn(a, b)
+    if ok:
+        print("OK")
+        return 0
+    print(f"DIFERENTE: contraexemplo '{contraexemplo}'")
+    return 1
+
+
+def _universal_cmd(args):
+    """Subcomando não interativo: universal <arquivo.json> (aceita todas as palavras?)."""
+    if len(args) != 1:
+        print("Uso: main.py universal <arquivo.json>", file=sys.stderr)
+        return 2
+
+    from testar_palavra import Automato
+    from antichains import universal_afn
+
+    automato = _carregar(Automato.from_json, args[0])
+    if automato is None:
+        return 2
+    ok, contraexemplo = universal_afn(automato)
+    if ok:
+        print("OK")
+        return 0
+    print(f"NÃO UNIVERSAL: palavra rejeitada '{contraexemplo}'")
+    return 1
+
+
+# subcomando -> opção do menu (os subcomandos interativos reaproveitam as CLIs)
+SUBCOMANDOS = {
+    "multi-afne": 0,
+    "afne-afn": 1,
+    "afn-afd": 2,
+    "minimizar": 3,
+}
+
+
+def _subcomando(argv):
+    nome, args = argv[0], argv[1:]
+    if nome == "testar":
+        return _testar_cmd(args)
+    if nome == "regex":
+        return _regex_cmd(args)
+    if nome in ("equivalentes", "incluso"):
+        return _comparar_cmd(nome, args)
+    if nome == "universal":
+        return _universal_cmd(args)
+    if nome in SUBCOMANDOS:
+        _executar_opcao(SUBCOMANDOS[nome])
+        return 0
+
+    print(f"Subcomando desconhecido: {nome}", file=sys.stderr)
+    print(f"Disponíveis: testar, regex, equivalentes, incluso, universal, {', '.join(SUBCOMANDOS)}", file=sys.stderr)
+    return 2
+
+
+def main(argv=None):
+    if argv is None:
+        argv = sys.argv[1:]
+    if argv:
+        return _subcomando(argv)
+
+    sessao = None  # área de trabalho (opção 6), criada no primeiro uso
     while True:
         print("\n=========================")
         print("          MENU             ")
@@ -17,6 +193,7 @@ def main():
         print("3 - Minimizar AFD")
         print("4 - Testar palavra")
         print("5 - Sair")
+        print("6 - Área de trabalho da sessão (autômatos e resultados mantidos em memória)")
 
         opcao = input("Escolha uma opcao: ")
 
@@ -25,38 +202,44 @@ def main():
 
             if opcao_int == 0:
                 try:
-                    converter_multi_para_afne_cli()
+                    _executar_opcao(0)
                 except Exception as e:
                     print(f"\nOcorreu um erro durante a conversão: {e}")
             elif opcao_int == 1:
                 try:
-                    converterAFNEpAFD = AFNEpAFN()
+                    _executar_opcao(1)
                 except Exception as e:
                     print(f"\nOcorreu um erro durante a conversão: {e}")
             elif opcao_int == 2:
                 try:
-                    converter_afn_para_afd_cli()
+                    _executar_opcao(2)
                 except Exception as e:
                     print(f"\nOcorreu um erro durante a conversão AFN→AFD: {e}")
             elif opcao_int == 3:
                 try:
-                    minimizar_afd_cli()
+                    _executar_opcao(3)
                 except Exception as e:
                     print(f"\nOcorreu um erro ao minimizar AFD: {e}")
             elif opcao_int == 4:
                 try:
-                    testar_palavra_cli()
+                    _executar_opcao(4)
                 except Exception as e:
                     print(f"\nOcorreu um erro ao testar palavra: {e}")
             elif opcao_int == 5:
                 print("\nEncerrando o programa. Até logo!")
                 break
+            elif opcao_int == 6:
+                from sessao import Sessao, sessao_cli
+                if sessao is None:
+                    sessao = Sessao()
+                sessao_cli(sessao)
             else:
-                print("\nOpção inválida! Por favor, escolha um número de 0 a 5.")
+                print("\nOpção inválida! Por favor, escolha um número de 0 a 6.")
 
         except ValueError:
             print("\nEntrada inválida! Por favor, digite apenas o número da opção.")
+    return 0
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
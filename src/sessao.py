@@ -0,0 +1,330 @@
+import sys
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple
+
+from testar_palavra import Automato, EPSILON
+
+
+# Área de trabalho da sessão interativa: autômatos com nome que ficam na memória
+# entre as ações do menu, para não recarregar o JSON nem refazer conversões.
+#
+# Cada autômato tem uma forma base (o `Automato` carregado/compilado, ou uma
+# tupla de AFD quando vem de um resultado salvo) que nunca é descartada, e
+# formas derivadas calculadas sob demanda e memoizadas:
+#   "sem_epsilon" -> Automato sem ε-transições (fechos-ε aplicados)
+#   "afd"         -> AFD em tupla (alfabeto, estados, inicial, finais, transicoes)
+#   "afd_minimo"  -> AFD mínimo em tupla
+#   "matcher"     -> função casar(palavra) gerada por gerar_matcher.py
+# As derivadas de todos os autômatos dividem um orçamento de memória; quando ele
+# é excedido, as menos usadas recentemente são descartadas (e recalculadas se
+# pedidas de novo).
+
+LIMITE_PADRAO = 512 * 1024 * 1024
+
+FORMAS = ("sem_epsilon", "afd", "afd_minimo", "matcher")
+
+
+def _tamanho_aproximado(obj) -> int:
+    """Soma de sys.getsizeof sobre o grafo de contêineres (cada objeto conta uma vez)."""
+    vistos = set()
+    pilha = [obj]
+    total = 0
+    while pilha:
+        atual = pilha.pop()
+        if id(atual) in vistos:
+            continue
+        vistos.add(id(atual))
+        total += sys.getsizeof(atual)
+        if isinstance(atual, dict):
+            pilha.extend(atual.keys())
+            pilha.extend(atual.values())
+        elif isinstance(atual, (list, tuple, set, frozenset)):
+            pilha.extend(atual)
+        elif isinstance(atual, Automato):
+            pilha.extend(getattr(atual, campo) for campo in Automato.__slots__)
+        elif callable(atual) and getattr(atual, "__defaults__", None):
+            # casadores gerados guardam a tabela nos valores padrão dos parâmetros
+            pilha.extend(atual.__defaults__)
+    return total
+
+
+def _afd_para_automato(afd) -> Automato:
+    alfabeto, estados, inicial, finais, transicoes = afd
+    return Automato(
+        estados, alfabeto, [inicial], finais,
+        {o: {s: {d} for s, d in mapa.items()} for o, mapa in transicoes.items()},
+    )
+
+
+class Sessao:
+    """
+    Autômatos nomeados e suas formas derivadas, mantidos entre as ações do menu.
+
+    - limite_bytes: orçamento (aproximado) para as formas derivadas
+    """
+
+    def __init__(self, limite_bytes: int = LIMITE_PADRAO) -> None:
+        self.limite_bytes = limite_bytes
+        self.bases: Dict[str, object] = {}
+        self.origens: Dict[str, str] = {}
+        # (nome, forma) -> (valor, tamanho), em ordem de uso (LRU)
+        self._derivados: "OrderedDict[Tuple[str, str], Tuple[object, int]]" = OrderedDict()
+        self._bytes_derivados = 0
+        self.acertos = 0
+        self.calculos = 0
+        self.descartes = 0
+
+    # ------------------------- Autômatos base ------------------------- #
+    def adicionar(self, nome: str, automato, origem: str = "") -> None:
+        """Guarda `automato` (`Automato` ou tupla de AFD) como `nome`, substituindo o anterior."""
+        if not nome:
+            raise ValueError("Nome vazio.")
+        self.remover(nome)
+        self.bases[nome] = automato
+        self.origens[nome] = origem
+
+    def carregar(self, nome: str, caminho: str) -> None:
+        self.adicionar(nome, Automato.from_json(caminho), origem=caminho)
+
+    def compilar_regex(self, nome: str, expressao: str) -> None:
+        from converter_regex import regex_para_automato
+        self.adicionar(nome, regex_para_automato(expressao), origem=f"regex {expressao}")
+
+    def promover(self, nome: str, forma: str, novo_nome: str) -> None:
+        """Guarda a forma derivada `forma` de `nome` como um novo autômato base."""
+        if forma not in ("sem_epsilon", "afd", "afd_minimo"):
+            raise ValueError(f"Forma não pode ser salva como autômato: {forma}")
+        valor = self.obter(nome, forma)
+        self.adicionar(novo_nome, valor, origem=f"{forma} de {nome}")
+
+    def remover(self, nome: str) -> None:
+        self.bases.pop(nome, None)
+        self.origens.pop(nome, None)
+        for chave in [c for c in self._derivados if c[0] == nome]:
+            _, tamanho = self._derivados.pop(chave)
+            self._bytes_derivados -= tamanho
+
+    def base(self, nome: str):
+        try:
+            return self.bases[nome]
+        except KeyError:
+            raise KeyError(f"Autômato '{nome}' não está na sessão.") from None
+
+    # ------------------------- Formas derivadas ------------------------- #
+    def obter(self, nome: str, forma: str):
+        """Retorna a forma derivada de `nome`, calculando-a só se não estiver em memória."""
+        if forma not in FORMAS:
+            raise ValueError(f"Forma desconhecida: {forma}")
+        chave = (nome, forma)
+        encontrado = self._derivados.get(chave)
+        if encontrado is not None:
+            self._derivados.move_to_end(chave)
+            self.acertos += 1
+            return encontrado[0]
+
+        valor = self._calcular(nome, forma)
+        self.calculos += 1
+        if valor is not self.bases[nome]:
+            tamanho = _tamanho_aproximado(valor)
+            self._derivados[chave] = (valor, tamanho)
+            self._bytes_derivados += tamanho
+            self._aplicar_limite(chave)
+        return valor
+
+    def _calcular(self, nome: str, forma: str):
+        base = self.base(nome)
+        if forma == "sem_epsilon":
+            if not isinstance(base, Automato):
+                return _afd_para_automato(base)
+            if any(EPSILON in mapa for mapa in base.transicoes.values()):
+                from converterAFNEpAFN import remover_epsilon
+                return remover_epsilon(base)
+            return base
+        if forma == "afd":
+            if not isinstance(base, Automato):
+                return base
+            from equivalencia import como_afd
+            return como_afd(self.obter(nome, "sem_epsilon"))
+        if forma == "afd_minimo":
+            from converter_minimizar_afd import minimizar_afd
+            return minimizar_afd(*self.obter(nome, "afd"))
+        from gerar_matcher import compilar_matcher
+        return compilar_matcher(*self.obter(nome, "afd_minimo"))
+
+    def _aplicar_limite(self, manter: Tuple[str, str]) -> None:
+        # descarta as menos usadas; a recém-calculada fica mesmo que sozinha exceda o limite
+        for chave in list(self._derivados):
+            if self._bytes_derivados <= self.limite_bytes:
+                break
+            if chave == manter:
+                continue
+            _, tamanho = self._derivados.pop(chave)
+            self._bytes_derivados -= tamanho
+            self.descartes += 1
+
+    def afd(self, nome: str):
+        return self.obter(nome, "afd")
+
+    def afd_minimo(self, nome: str):
+        return self.obter(nome, "afd_minimo")
+
+    def matcher(self, nome: str) -> Callable[[str], bool]:
+        return self.obter(nome, "matcher")
+
+    def residente(self, nome: str, forma: str) -> bool:
+        """A forma derivada já está em memória (não precisa ser calculada)?"""
+        return (nome, forma) in self._derivados
+
+    def testador(self, nome: str, compilar: bool = False) -> Callable[[str], bool]:
+        """
+        Função palavra -> bool usando a forma mais barata disponível: o casador
+        compilado ou um AFD já em memória; senão, a simulação do AFN sem ε
+        (`Automato.aceita`), que não faz a construção de subconjuntos. Com
+        compilar=True, calcula o casador (AFD mínimo) se preciso.
+        """
+        base = self.base(nome)
+        if compilar or self.residente(nome, "matcher"):
+            return self.matcher(nome)
+        if not isinstance(base, Automato):
+            return _testador_afd(base)
+        for forma in ("afd_minimo", "afd"):
+            if self.residente(nome, forma):
+                return _testador_afd(self.obter(nome, forma))
+        return self.obter(nome, "sem_epsilon").aceita
+
+    def aceita(self, nome: str, palavra: str) -> bool:
+        return self.testador(nome)(palavra)
+
+    # ------------------------- Consulta ------------------------- #
+    def listar(self) -> List[Tuple[str, str, List[str]]]:
+        """(nome, origem, formas derivadas em memória) de cada autômato."""
+        return [
+            (nome, self.origens[nome], [f for f in FORMAS if (nome, f) in self._derivados])
+            for nome in self.bases
+        ]
+
+    def estatisticas(self) -> Dict[str, int]:
+        return {
+            "automatos": len(self.bases),
+            "derivados": len(self._derivados),
+            "bytes_derivados": self._bytes_derivados,
+            "acertos": self.acertos,
+            "calculos": self.calculos,
+            "descartes": self.descartes,
+        }
+
+
+def _testador_afd(afd) -> Callable[[str], bool]:
+    _, _, inicial, finais, transicoes = afd
+    finais_set = set(finais)
+
+    def aceita(palavra: str) -> bool:
+        estado = inicial
+        for c in palavra:
+            estado = transicoes.get(estado, {}).get(c)
+            if estado is None:
+                return False
+        return estado in finais_set
+
+    return aceita
+
+
+def _imprimir_afd(afd) -> None:
+    alfabeto, estados, inicial, finais, trans = afd
+    print("Alfabeto:", alfabeto)
+    print("Estados:", estados)
+    print("Estado Inicial:", inicial)
+    print("Estados Finais:", finais)
+    print("Transições:")
+    for origem in sorted(trans.keys()):
+        for simbolo in alfabeto:
+            destino = trans[origem].get(simbolo)
+            if destino is not None:
+                print(f"{origem} --{simbolo}--> {destino}")
+
+
+def _escolher(sessao: Sessao, rotulo: str = "Autômato") -> Optional[str]:
+    if not sessao.bases:
+        print("A área de trabalho está vazia. Carregue um autômato antes (opção 1 ou 2).")
+        return None
+    nomes = list(sessao.bases)
+    padrao = nomes[-1]
+    nome = input(f"{rotulo} [{padrao}]: ").strip() or padrao
+    if nome not in sessao.bases:
+        print(f"Autômato '{nome}' não está na sessão. Disponíveis: {', '.join(nomes)}")
+        return None
+    return nome
+
+
+def _oferecer_salvar(sessao: Sessao, nome: str, forma: str) -> None:
+    novo = input("Salvar o resultado na sessão como (vazio para não salvar): ").strip()
+    if novo:
+        sessao.promover(nome, forma, novo)
+        print(f"Resultado salvo como '{novo}'.")
+
+
+def sessao_cli(sessao: Sessao) -> None:
+    while True:
+        print("\n=========================")
+        print("Área de trabalho da sessão")
+        print("=========================\n")
+        print("1 - Carregar autômato de arquivo JSON")
+        print("2 - Compilar expressão regular")
+        print("3 - Listar autômatos da sessão")
+        print("4 - Converter para AFD")
+        print("5 - Minimizar AFD")
+        print("6 - Testar palavras")
+        print("7 - Remover autômato")
+        print("8 - Voltar")
+        opcao = input("Escolha uma opcao: ").strip()
+
+        try:
+            if opcao == "1":
+                path = input("Caminho do arquivo JSON [automato.json]: ").strip() or "automato.json"
+                nome = input("Nome na sessão [a]: ").strip() or "a"
+                sessao.carregar(nome, path)
+                print(f"'{nome}' carregado.")
+            elif opcao == "2":
+                expressao = input("Expressão regular: ").strip()
+                nome = input("Nome na sessão [r]: ").strip() or "r"
+                sessao.compilar_regex(nome, expressao)
+                print(f"'{nome}' compilado.")
+            elif opcao == "3":
+                for nome, origem, formas in sessao.listar():
+                    print(f"{nome}\t{origem}\tem memória: {', '.join(formas) or '-'}")
+                est = sessao.estatisticas()
+                print(f"Derivados: {est['derivados']} ({est['bytes_derivados']} bytes aprox.), "
+                      f"reaproveitados: {est['acertos']}, calculados: {est['calculos']}, "
+                      f"descartados: {est['descartes']}")
+            elif opcao in ("4", "5"):
+                nome = _escolher(sessao)
+                if nome is None:
+                    continue
+                forma = "afd" if opcao == "4" else "afd_minimo"
+                print()
+                _imprimir_afd(sessao.obter(nome, forma))
+                print()
+                _oferecer_salvar(sessao, nome, forma)
+            elif opcao == "6":
+                nome = _escolher(sessao)
+                if nome is None:
+                    continue
+                resposta = input("Compilar casador a partir do AFD mínimo? (s/N): ").strip().lower()
+                casar = sessao.testador(nome, compilar=resposta == "s")
+                print("Digite as palavras (linha vazia para voltar).")
+                while True:
+                    w = input("Palavra: ")
+                    if not w:
+                        break
+                    print("ACEITA" if casar(w) else "REJEITA")
+            elif opcao == "7":
+                nome = _escolher(sessao)
+                if nome is not None:
+                    sessao.remover(nome)
+                    print(f"'{nome}' removido.")
+            elif opcao == "8":
+                return
+            else:
+                print("\nOpção inválida! Por favor, escolha um número de 1 a 8.")
+        except Exception as e:
+            print(f"\nOcorreu um erro: {e}")
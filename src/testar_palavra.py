@@ -1,5 +1,5 @@
 import json
-from typing import Dict, Set, Iterable, Tuple, List
+from typing import Dict, Set, Iterable, Iterator, Tuple, List
 
 
 EPSILON = "ε"
@@ -14,8 +14,12 @@ class Automato:
     - iniciais: conjunto de estados iniciais
     - finais: conjunto de estados finais
     - transicoes: dict no formato: { origem: { simbolo: set(destinos) } }
+
+    Para autômatos grandes, veja `AutomatoCompacto` (automato_compacto.py).
     """
 
+    __slots__ = ("estados", "alfabeto", "iniciais", "finais", "transicoes")
+
     def __init__(
         self,
         estados: Iterable[str],
@@ -62,37 +66,10 @@ class Automato:
         Também aceita transições como objetos: {"origem":"Q1","destino":"Q2","simbolo":"a"}.
         Aceita chave alternativa "alfabet0" (com zero) mapeando para "alfabeto".
         """
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-
-        # tolerância: "alfabet0" -> "alfabeto"
-        if "alfabeto" not in data and "alfabet0" in data:
-            data["alfabeto"] = data["alfabet0"]
-
-        required = ["alfabeto", "estados", "estadosF", "estadosI", "transicoes"]
-        faltando = [k for k in required if k not in data]
-        if faltando:
-            raise ValueError(f"Chaves faltando no JSON: {', '.join(faltando)}")
-
-        alfabeto = _as_list_of_str(data["alfabeto"], "alfabeto")
-        estados = _as_list_of_str(data["estados"], "estados")
-        finais = _as_list_of_str(data["estadosF"], "estadosF")
-        iniciais = _as_list_of_str(data["estadosI"], "estadosI")
-        transicoes_brutas = data["transicoes"]
+        estados, alfabeto, iniciais, finais, triplas = _ler_json(path)
 
         transicoes: Dict[str, Dict[str, Set[str]]] = {}
-        for item in transicoes_brutas:
-            if isinstance(item, list) and len(item) == 3:
-                origem, destino, simbolo = item[0], item[1], item[2]
-            elif isinstance(item, dict):
-                origem = item.get("origem")
-                destino = item.get("destino")
-                simbolo = item.get("simbolo")
-            else:
-                raise ValueError(
-                    "Transição inválida. Use [origem, destino, simbolo] ou {origem,destino,simbolo}."
-                )
-
+        for origem, destino, simbolo in triplas:
             if origem not in transicoes:
                 transicoes[origem] = {}
             if simbolo not in transicoes[origem]:
@@ -190,6 +167,51 @@ class Automato:
         return any(e in self.finais for e in atuais)
 
 
+def _ler_json(path: str) -> Tuple[List[str], List[str], List[str], List[str], Iterator[Tuple[str, str, str]]]:
+    """
+    Lê o JSON de um autômato e retorna (estados, alfabeto, iniciais, finais, triplas),
+    onde triplas é um gerador de (origem, destino, simbolo), a ser consumido uma
+    única vez. Usado pelos carregadores de `Automato` e `AutomatoCompacto`.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+
+    # tolerância: "alfabet0" -> "alfabeto"
+    if "alfabeto" not in data and "alfabet0" in data:
+        data["alfabeto"] = data["alfabet0"]
+
+    required = ["alfabeto", "estados", "estadosF", "estadosI", "transicoes"]
+    faltando = [k for k in required if k not in data]
+    if faltando:
+        raise ValueError(f"Chaves faltando no JSON: {', '.join(faltando)}")
+
+    alfabeto = _as_list_of_str(data["alfabeto"], "alfabeto")
+    estados = _as_list_of_str(data["estados"], "estados")
+    finais = _as_list_of_str(data["estadosF"], "estadosF")
+    iniciais = _as_list_of_str(data["estadosI"], "estadosI")
+
+    lista = data.pop("transicoes")
+    return estados, alfabeto, iniciais, finais, _triplas(lista)
+
+
+def _triplas(lista: list) -> Iterator[Tuple[str, str, str]]:
+    # gera as transições sem montar outra lista e libera cada item já lido, para
+    # que o pico de memória não seja JSON + triplas + dicts
+    for i, item in enumerate(lista):
+        lista[i] = None
+        if isinstance(item, list) and len(item) == 3:
+            origem, destino, simbolo = item[0], item[1], item[2]
+        elif isinstance(item, dict):
+            origem = item.get("origem")
+            destino = item.get("destino")
+            simbolo = item.get("simbolo")
+        else:
+            raise ValueError(
+                "Transição inválida. Use [origem, destino, simbolo] ou {origem,destino,simbolo}."
+            )
+        yield origem, destino, simbolo
+
+
 def _as_list_of_str(obj, field: str) -> List[str]:
     if isinstance(obj, list):
         return [str(x) for x in obj]